@@ -6,17 +6,17 @@ Usage: python -m pipeline.cli --pipeline config/pipeline.yaml
 from __future__ import annotations
 
 import argparse
+import os
 import time
+from functools import lru_cache, reduce
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
-import yaml
-from dotenv import load_dotenv
+from pipeline.common.utils import ts, clean_directory, load_yaml, load_yaml_cached, parse_yaml
+from pipeline.common.logger import get_logger, init_logger, LogLevel, LogFormat
 
-from pipeline.common.utils import ts, safe_mkdir, clean_directory, load_yaml
-from pipeline.core.orchestrator import orchestrator
-from pipeline.common.logger import init_logger, LogLevel, LogFormat
-from pipeline.common.validators import validate_pipeline
+# Heavy modules (orchestrator, validators, dotenv) are imported lazily in
+# main() so --validate/--dry-run don't pay for engines they never use.
 
 
 def main() -> None:
@@ -75,6 +75,7 @@ Examples:
     init_logger(args.log_level, log_format)
 
     # Load environment
+    from dotenv import load_dotenv
     load_dotenv(args.dotenv) if args.dotenv else load_dotenv()
 
     # Load pipeline configuration
@@ -82,15 +83,22 @@ Examples:
     if not pipeline_path.exists():
         raise FileNotFoundError(f"Pipeline config not found: {pipeline_path}")
 
-    from pipeline.common.logger import get_logger
     log = get_logger()
 
-    log.info(f"Loading pipeline: {pipeline_path}")
-    pipeline_config = load_yaml(pipeline_path)
+    if args.validate or args.dry_run:
+        pipeline_config = load_yaml_cached(pipeline_path)
+    else:
+        pipeline_config = load_yaml(pipeline_path)
 
     if not pipeline_config:
         raise ValueError(f"Empty or invalid pipeline config: {pipeline_path}")
 
+    meta = pipeline_config.get("pipeline")
+    if isinstance(meta, dict) and meta.get("name"):
+        log.info(f"Loading pipeline: {meta['name']} (v{meta.get('version', '?')}) from {pipeline_path}")
+    else:
+        log.info(f"Loading pipeline: {pipeline_path}")
+
     # Apply --set overrides
     if args.set:
         for override in args.set:
@@ -104,7 +112,7 @@ Examples:
     output_dir = Path(variables.get("OUTPUT_DIR", "./out/exports"))
 
     # Ensure directories exist
-    safe_mkdir(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
 
     # Validation mode (--validate or --dry-run)
     if args.validate or args.dry_run:
@@ -112,10 +120,8 @@ Examples:
         log.info(f"{mode_name} MODE - Validating pipeline")
         log.info("")
 
-        # Run basic validation
-        _validate_pipeline(pipeline_config)
-
-        # Run comprehensive validation
+        # Run comprehensive validation (includes the basic structure checks)
+        from pipeline.common.validators import validate_pipeline
         # Use current working directory as base path for resolving relative paths
         is_valid = validate_pipeline(pipeline_config, base_path=Path.cwd())
 
@@ -127,6 +133,7 @@ Examples:
         return
 
     # Execute pipeline
+    from pipeline.core.orchestrator import orchestrator
     log.info("Starting pipeline execution")
     orchestrator(
         pipeline_config=pipeline_config,
@@ -140,75 +147,30 @@ Examples:
     log.info("========================================")
 
 
+@lru_cache(maxsize=128)
+def _split_dotted(dotted_key: str) -> Tuple[str, ...]:
+    """Split a dotted key once; scripted runs often repeat the same keys"""
+    return tuple(dotted_key.split("."))
+
+
+def _child_dict(node: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Return node[key], replacing missing or non-dict values with {}"""
+    child = node.get(key)
+    if not isinstance(child, dict):
+        child = node[key] = {}
+    return child
+
+
 def _set_dotted(config: Dict[str, Any], dotted_key: str, value: str) -> None:
     """Set a value in nested dict using dotted notation"""
     # Try to parse value as YAML for proper types
     try:
-        parsed_value = yaml.safe_load(value)
+        parsed_value = parse_yaml(value)
     except Exception:
         parsed_value = value
 
-    parts = dotted_key.split(".")
-    current = config
-
-    for part in parts[:-1]:
-        if part not in current or not isinstance(current[part], dict):
-            current[part] = {}
-        current = current[part]
-
-    current[parts[-1]] = parsed_value
-
-
-def _validate_pipeline(config: Dict[str, Any]) -> None:
-    """Validate pipeline configuration"""
-    # Check required sections
-    required = ["stages", "jobs", "runners"]
-    for section in required:
-        if section not in config:
-            raise ValueError(f"Missing required section: {section}")
-
-    # Check stages
-    stages = config.get("stages", [])
-    if not stages:
-        raise ValueError("No stages defined")
-
-    # Check jobs
-    jobs = config.get("jobs", {})
-    if not jobs:
-        raise ValueError("No jobs defined")
-
-    # Validate each job
-    for job_name, job_config in jobs.items():
-        if "stage" not in job_config:
-            raise ValueError(f"Job '{job_name}' missing required field: stage")
-
-        job_stage = job_config["stage"]
-        if job_stage not in stages:
-            raise ValueError(f"Job '{job_name}' references unknown stage: {job_stage}")
-
-        if "runner" not in job_config:
-            raise ValueError(f"Job '{job_name}' missing required field: runner")
-
-        runner_name = job_config["runner"]
-        runners = config.get("runners", {})
-        if runner_name not in runners:
-            raise ValueError(f"Job '{job_name}' references unknown runner: {runner_name}")
-
-    # Validate dependencies
-    job_names = set(jobs.keys())
-    for job_name, job_config in jobs.items():
-        depends_on = job_config.get("depends_on", [])
-        for dep in depends_on:
-            if dep not in job_names:
-                raise ValueError(f"Job '{job_name}' depends on unknown job: {dep}")
-
-    from pipeline.common.logger import get_logger
-    log = get_logger()
-
-    log.success(f"Stages: {len(stages)}")
-    log.success(f"Jobs: {len(jobs)}")
-    log.success(f"Runners: {len(config.get('runners', {}))}")
-    log.success("Dependencies validated")
+    *parents, leaf = _split_dotted(dotted_key)
+    reduce(_child_dict, parents, config)[leaf] = parsed_value
 
 
 if __name__ == "__main__":
@@ -12,10 +12,24 @@ Provides type-safe, validated configuration models for:
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, field_validator, model_validator
+
+
+# ============================================================================
+# Base Model
+# ============================================================================
+
+class _ConfigModel(BaseModel):
+    """
+    Base for all config models. Validators are built on first use rather
+    than at import, so modules that only need one model (e.g. the DuckDB
+    engine checking DuckDBConfig) don't pay for the whole tree.
+    """
+    model_config = ConfigDict(defer_build=True)
 
 
 # ============================================================================
@@ -63,7 +77,7 @@ class IfExists(str, Enum):
 # Database Configuration Models
 # ============================================================================
 
-class DuckDBConfig(BaseModel):
+class DuckDBConfig(_ConfigModel):
     """DuckDB-specific configuration"""
     threads: Optional[int] = Field(default=4, description="Number of threads")
     memory_limit: Optional[str] = Field(default="4GB", description="Memory limit")
@@ -71,14 +85,14 @@ class DuckDBConfig(BaseModel):
     preserve_insertion_order: Optional[bool] = Field(default=False)
 
 
-class SQLiteConfig(BaseModel):
+class SQLiteConfig(_ConfigModel):
     """SQLite-specific configuration"""
     timeout: Optional[float] = Field(default=10.0, description="Connection timeout")
     check_same_thread: Optional[bool] = Field(default=False, description="Allow multi-threaded access")
     init_sql: Optional[List[str]] = Field(default_factory=list, description="Initialization SQL statements")
 
 
-class DatabaseConfig(BaseModel):
+class DatabaseConfig(_ConfigModel):
     """Database configuration"""
     type: DatabaseType = Field(..., description="Database engine type")
     path: str = Field(..., description="Database file path")
@@ -86,7 +100,8 @@ class DatabaseConfig(BaseModel):
     schemas: List[str] = Field(default_factory=list, description="Schemas to create")
 
     # Engine-specific configs
-    config: Optional[Union[DuckDBConfig, Dict[str, Any]]] = Field(default=None, description="Engine-specific config")
+    # Kept as a plain dict; DuckDBConfig is validated lazily by the DuckDB engine
+    config: Optional[Dict[str, Any]] = Field(default=None, description="Engine-specific config")
     pragmas: Optional[Dict[str, Any]] = Field(default=None, description="Legacy pragma support")
     extensions: Optional[List[str]] = Field(default=None, description="DuckDB extensions to load")
 
@@ -110,14 +125,14 @@ class DatabaseConfig(BaseModel):
 # Job Configuration Models
 # ============================================================================
 
-class ProcessorConfig(BaseModel):
+class ProcessorConfig(_ConfigModel):
     """Processor configuration in a job"""
     name: str = Field(..., description="Processor name")
     # Allow any additional fields for processor-specific options
     model_config = {"extra": "allow"}
 
 
-class JobInputConfig(BaseModel):
+class JobInputConfig(_ConfigModel):
     """Job input configuration"""
     path: Optional[str] = Field(default=None, description="Input file path or directory")
     files: Optional[str] = Field(default=None, description="File pattern (glob or specific)")
@@ -134,7 +149,7 @@ class JobInputConfig(BaseModel):
     model_config = {"extra": "allow"}
 
 
-class JobOutputConfig(BaseModel):
+class JobOutputConfig(_ConfigModel):
     """Job output configuration"""
     table: Optional[str] = Field(default=None, description="Output table name")
     path: Optional[str] = Field(default=None, description="Output file path")
@@ -145,14 +160,14 @@ class JobOutputConfig(BaseModel):
     model_config = {"extra": "allow"}
 
 
-class StagerOptions(BaseModel):
+class StagerOptions(_ConfigModel):
     """Options for stager jobs"""
     if_exists: IfExists = Field(default=IfExists.REPLACE, description="Table existence handling")
     as_table: bool = Field(default=True, description="Create as TABLE (true) or VIEW (false)")
     table_prefix: str = Field(default="", description="Prefix for staged table names")
 
 
-class JobConfig(BaseModel):
+class JobConfig(_ConfigModel):
     """Job definition"""
     stage: str = Field(..., description="Pipeline stage this job belongs to")
     runner: str = Field(..., description="Runner name to use")
@@ -168,7 +183,8 @@ class JobConfig(BaseModel):
         description="Processors to apply"
     )
 
-    options: Optional[Union[StagerOptions, Dict[str, Any]]] = Field(
+    # Kept as a plain dict; StagerOptions is validated lazily by stage jobs
+    options: Optional[Dict[str, Any]] = Field(
         default=None,
         description="Job-specific options"
     )
@@ -186,7 +202,7 @@ class JobConfig(BaseModel):
 # Runner Configuration Models
 # ============================================================================
 
-class RunnerConfig(BaseModel):
+class RunnerConfig(_ConfigModel):
     """Runner definition"""
     type: RunnerType = Field(..., description="Runner type")
     plugin: str = Field(..., description="Plugin name")
@@ -197,7 +213,7 @@ class RunnerConfig(BaseModel):
 # Execution & Reporting Models
 # ============================================================================
 
-class ExecutionPolicy(BaseModel):
+class ExecutionPolicy(_ConfigModel):
     """Execution policy configuration"""
     on_error: ErrorPolicy = Field(default=ErrorPolicy.STOP, description="Error handling policy")
     parallel_jobs: bool = Field(default=False, description="Enable parallel job execution")
@@ -206,26 +222,27 @@ class ExecutionPolicy(BaseModel):
     clean_temp_on_success: bool = Field(default=False, description="Clean temporary files on success")
 
 
-class ReportingConfig(BaseModel):
+class ReportingConfig(_ConfigModel):
     """Reporting configuration"""
     enabled: bool = Field(default=True, description="Enable reporting")
     path: str = Field(default="reports/pipeline_report.html", description="Report output path")
     include_dbt_results: bool = Field(default=True, description="Include dbt results")
     include_detailed_logs: bool = Field(default=True, description="Include detailed logs")
+    estimate_row_counts: bool = Field(default=False, description="Use DuckDB's stored row estimates instead of COUNT(*) (can be stale after DELETEs)")
 
 
 # ============================================================================
 # Main Pipeline Configuration Model
 # ============================================================================
 
-class PipelineMetadata(BaseModel):
+class PipelineMetadata(_ConfigModel):
     """Pipeline metadata"""
     name: str = Field(..., description="Pipeline name")
     version: str = Field(..., description="Pipeline version")
     description: Optional[str] = Field(default=None, description="Pipeline description")
 
 
-class PipelineConfig(BaseModel):
+class PipelineConfig(_ConfigModel):
     """Complete pipeline configuration"""
     pipeline: PipelineMetadata = Field(..., description="Pipeline metadata")
 
@@ -243,60 +260,82 @@ class PipelineConfig(BaseModel):
 
     runners: Dict[str, RunnerConfig] = Field(..., description="Runner definitions")
 
+    # Reporting stats gathered during the reference-validation pass
+    _ref_stats: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
     @model_validator(mode='after')
-    def validate_job_stages(self) -> 'PipelineConfig':
-        """Validate that all job stages exist in the stages list"""
+    def validate_job_references(self) -> 'PipelineConfig':
+        """Validate job stage, dependency, runner and database references in one pass"""
         defined_stages = set(self.stages)
+        job_names = set(self.jobs.keys())
+        defined_runners = set(self.runners.keys())
+        defined_dbs = set(self.databases.keys())
+        total_deps = 0
+
         for job_name, job in self.jobs.items():
             if job.stage not in defined_stages:
                 raise ValueError(
                     f"Job '{job_name}' references undefined stage '{job.stage}'. "
-                    f"Available stages: {', '.join(defined_stages)}"
+                    f"Available stages: {', '.join(self.stages)}"
                 )
-        return self
-
-    @model_validator(mode='after')
-    def validate_job_dependencies(self) -> 'PipelineConfig':
-        """Validate that all job dependencies exist"""
-        job_names = set(self.jobs.keys())
-        for job_name, job in self.jobs.items():
             for dep in job.depends_on:
                 if dep not in job_names:
                     raise ValueError(
                         f"Job '{job_name}' depends on non-existent job '{dep}'. "
                         f"Available jobs: {', '.join(sorted(job_names))}"
                     )
-        return self
-
-    @model_validator(mode='after')
-    def validate_job_runners(self) -> 'PipelineConfig':
-        """Validate that all job runners are defined"""
-        defined_runners = set(self.runners.keys())
-        for job_name, job in self.jobs.items():
+            total_deps += len(job.depends_on)
             if job.runner not in defined_runners:
                 raise ValueError(
                     f"Job '{job_name}' uses undefined runner '{job.runner}'. "
                     f"Available runners: {', '.join(sorted(defined_runners))}"
                 )
-        return self
-
-    @model_validator(mode='after')
-    def validate_job_databases(self) -> 'PipelineConfig':
-        """Validate that job database references exist"""
-        defined_dbs = set(self.databases.keys())
-        for job_name, job in self.jobs.items():
             if job.database and job.database not in defined_dbs:
                 raise ValueError(
                     f"Job '{job_name}' references undefined database '{job.database}'. "
                     f"Available databases: {', '.join(sorted(defined_dbs))}"
                 )
+
+        self._ref_stats = {
+            'total_deps': total_deps,
+            'runner_types': frozenset(r.type.value for r in self.runners.values()),
+            'db_types': frozenset(db.type.value for db in self.databases.values()),
+        }
         return self
 
 
+@lru_cache(maxsize=None)
+def _subtree_adapters() -> Dict[str, TypeAdapter]:
+    """
+    Adapters for the large per-entry mappings, built once on first use.
+    Subtrees validated here are passed to PipelineConfig as model instances,
+    which pydantic accepts without revalidating.
+    """
+    return {
+        "jobs": TypeAdapter(Dict[str, JobConfig]),
+        "runners": TypeAdapter(Dict[str, RunnerConfig]),
+        "databases": TypeAdapter(Dict[str, DatabaseConfig]),
+    }
+
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
 
+def build_pipeline_config(raw_config: Dict[str, Any]) -> PipelineConfig:
+    """
+    Validate a raw configuration dict into a PipelineConfig
+
+    Batch-validates the jobs/runners/databases mappings with prebuilt
+    TypeAdapters before assembling the top-level model.
+    """
+    data = dict(raw_config)
+    for key, adapter in _subtree_adapters().items():
+        if isinstance(data.get(key), dict):
+            data[key] = adapter.validate_python(data[key])
+    return PipelineConfig(**data)
+
+
 def load_and_validate_config(yaml_path: Path) -> PipelineConfig:
     """
     Load and validate pipeline configuration from YAML file
@@ -310,17 +349,18 @@ def load_and_validate_config(yaml_path: Path) -> PipelineConfig:
     Raises:
         FileNotFoundError: If YAML file doesn't exist
         ValidationError: If configuration is invalid
+
+    The parsed YAML is cached on disk keyed by the file contents (see
+    utils.load_yaml_cached), so an unchanged file skips YAML parsing; the
+    result is validated on every load.
     """
-    import yaml
+    from pipeline.common.utils import load_yaml_cached
 
     if not yaml_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {yaml_path}")
 
-    with open(yaml_path, 'r', encoding='utf-8') as f:
-        raw_config = yaml.safe_load(f)
-
-    # Validate and return
-    return PipelineConfig(**raw_config)
+    raw_config = load_yaml_cached(yaml_path)
+    return build_pipeline_config(raw_config)
 
 
 def config_to_dict(config: PipelineConfig) -> Dict[str, Any]:
@@ -338,14 +378,18 @@ def get_validation_summary(config: PipelineConfig) -> Dict[str, Any]:
     Returns:
         Dictionary with validation statistics for HTML report
     """
-    # Count dependencies
-    total_deps = sum(len(job.depends_on) for job in config.jobs.values())
-
-    # Get unique runner types
-    runner_types = list(set(r.type.value for r in config.runners.values()))
-
-    # Get database types
-    db_types = list(set(db.type.value for db in config.databases.values()))
+    # Dependency count and runner/database types were gathered during validation
+    stats = config._ref_stats
+    if not stats.keys() >= {'total_deps', 'runner_types', 'db_types'}:
+        # Built without validation (e.g. model_construct): derive from the model
+        stats = {
+            'total_deps': sum(len(job.depends_on) for job in config.jobs.values()),
+            'runner_types': {r.type.value for r in config.runners.values()},
+            'db_types': {db.type.value for db in config.databases.values()},
+        }
+    total_deps = stats['total_deps']
+    runner_types = list(stats['runner_types'])
+    db_types = list(stats['db_types'])
 
     return {
         'status': 'VALID',
@@ -5,6 +5,9 @@ Provides expectation-based data quality checks with configurable actions
 """
 from __future__ import annotations
 
+import inspect
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -32,7 +35,7 @@ class ExpectationType(str, Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityResult:
     """Result of a quality check"""
     expectation_name: str
@@ -42,7 +45,8 @@ class QualityResult:
     rows_failed: int
     failure_pct: float
     message: str
-    failed_rows: Optional[pl.DataFrame] = None
+    failed_rows: Optional[pl.LazyFrame] = None  # Collected only when quarantined or by the caller
+    failed_mask: Optional[pl.Series] = None  # Boolean mask of quarantined rows in the validated frame
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def __str__(self) -> str:
@@ -54,7 +58,7 @@ class QualityResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Expectation:
     """
     Data quality expectation
@@ -91,6 +95,61 @@ class Expectation:
     config: Dict[str, Any] = field(default_factory=dict)
     action: QualityAction = QualityAction.FAIL
     threshold_pct: float = 0.0  # Allow % failures before triggering action
+    # (key, expr) cache for the regex / in_set predicate, reused across validate() calls
+    _compiled: Any = field(default=None, init=False, repr=False, compare=False)
+
+
+# Expectation types evaluated as a boolean "row failed" expression
+_EXPR_TYPES = frozenset({
+    ExpectationType.NOT_NULL,
+    ExpectationType.UNIQUE,
+    ExpectationType.IN_SET,
+    ExpectationType.BETWEEN,
+    ExpectationType.REGEX_MATCH,
+})
+
+
+def _polars_version() -> tuple:
+    """(major, minor) of the installed Polars ((0, 0) if it cannot be parsed)"""
+    parts = str(getattr(pl, "__version__", "")).split(".")[:2]
+    return tuple(int(p) if p.isdigit() else 0 for p in parts)
+
+
+# Pick the streaming collect call once at import: engine="streaming" exists
+# from Polars 1.23; older releases spell it streaming=True. Real collect errors
+# (e.g. from a map_elements UDF) then propagate unchanged.
+try:
+    _COLLECT_PARAMS = inspect.signature(pl.LazyFrame.collect).parameters
+    _STREAMING_KWARGS: Dict[str, Any] = (
+        {"streaming": True}
+        if "engine" not in _COLLECT_PARAMS
+        or ("streaming" in _COLLECT_PARAMS and _polars_version() < (1, 23))
+        else {"engine": "streaming"}
+    )
+except (TypeError, ValueError):
+    _STREAMING_KWARGS = {"engine": "streaming"} if _polars_version() >= (1, 23) else {"streaming": True}
+
+
+def _collect(frame: Union[pl.DataFrame, pl.LazyFrame]) -> pl.DataFrame:
+    """Collect a LazyFrame with the streaming engine (DataFrames pass through)"""
+    if isinstance(frame, pl.DataFrame):
+        return frame
+    return frame.collect(**_STREAMING_KWARGS)
+
+
+# Max (columns, expectations) entries kept in QualityValidator's fused-expression cache
+_EXPR_CACHE_SIZE = 32
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable snapshot of a config value (dicts/lists/sets become tuples/frozensets)"""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
 
 
 class QualityValidator:
@@ -107,23 +166,53 @@ class QualityValidator:
         """
         self.quarantine_dir = quarantine_dir
         self.results: List[QualityResult] = []
+        # Quarantine parquet writes run here, overlapping the next expectation
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quarantine")
+        self._pending: List[Future] = []
+        # (columns, expectation keys) -> (preds, sums), LRU-ordered
+        self._expr_cache: OrderedDict[tuple, tuple] = OrderedDict()
+
+    def close(self) -> None:
+        """Wait for pending quarantine writes and stop the writer thread"""
+        self._drain()
+        self._io.shutdown(wait=True)
+
+    def __enter__(self) -> "QualityValidator":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _drain(self) -> None:
+        """Block until queued quarantine writes finish, re-raising any write error"""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
 
     def validate(
         self,
-        df: pl.DataFrame,
+        df: Union[pl.DataFrame, pl.LazyFrame],
         expectations: List[Expectation],
         context: Optional[Dict[str, Any]] = None
-    ) -> tuple[pl.DataFrame, List[QualityResult]]:
+    ) -> tuple[Union[pl.DataFrame, pl.LazyFrame], List[QualityResult]]:
         """
         Validate DataFrame against expectations
 
+        Failure counts for all column-level expectations are computed in a
+        single lazy select so Polars can scan each column once; failed rows
+        are only materialized for expectations that actually fail.
+
+        A LazyFrame (e.g. from pl.scan_parquet) is validated in streaming
+        mode: counts are collected with the streaming engine, only failing
+        rows are materialized, and the clean result stays a LazyFrame.
+
         Args:
-            df: DataFrame to validate
+            df: DataFrame or LazyFrame to validate
             expectations: List of expectations to check
             context: Optional context metadata (run_id, dataset_name, etc.)
 
         Returns:
-            (clean_df, results) - Clean rows and validation results
+            (clean_df, results) - Clean rows (same kind as `df`) and validation results
 
         Raises:
             ValueError: If any FAIL action expectation fails
@@ -131,219 +220,242 @@ class QualityValidator:
         self.results = []
         clean_df = df
         context = context or {}
-
-        for exp in expectations:
-            result = self._run_expectation(df, exp)
+        lazy = isinstance(df, pl.LazyFrame)
+        columns = df.collect_schema().names() if lazy else df.columns
+        # Rows to drop: a mask over `df` when eager, a predicate when lazy
+        quarantine_drop: Union[pl.Series, pl.Expr, None] = None
+        # Materialized frame for custom checks (lazy input collects it on demand)
+        frame: Optional[pl.DataFrame] = None if lazy else df
+
+        # Row count of a scan is answered from metadata / a fast line count
+        n_rows = _collect(df.select(pl.len())).item() if lazy else len(df)
+
+        # Metadata-only checks read no column data; run them first so a
+        # FAIL (e.g. missing required column) raises before anything is scanned
+        early: Dict[int, QualityResult] = {}
+        for i, exp in enumerate(expectations):
+            if exp.type == ExpectationType.ROW_COUNT_BETWEEN:
+                early[i] = self._expect_row_count_between(exp, n_rows)
+            elif exp.type == ExpectationType.COLUMN_EXISTS:
+                early[i] = self._expect_column_exists(exp, columns, n_rows)
+            else:
+                continue
+            if not early[i].passed and exp.action == QualityAction.FAIL:
+                self.results = list(early.values())
+                raise self._failure_error(early[i], context)
+
+        # Failure predicates for all column checks, counted in one pass
+        preds, sums = self._fused_exprs(expectations, columns)
+        counts: Dict[int, int] = {}
+        if preds:
+            counts = dict(zip(preds, _collect(df.lazy().select(sums)).row(0)))
+
+        for i, exp in enumerate(expectations):
+            if i in early:
+                result = early[i]
+            elif i in preds:
+                result = self._expr_result(df, exp, preds[i], counts[i] or 0, n_rows)
+            elif exp.type in _EXPR_TYPES:
+                result = self._missing_column_result(exp)
+            else:
+                if frame is None:
+                    frame = _collect(df)
+                result = self._run_expectation(frame, exp)
             self.results.append(result)
 
             if not result.passed:
                 # Handle failed expectation
                 if exp.action == QualityAction.FAIL:
-                    raise ValueError(
-                        f"Data quality check failed: {result}\n"
-                        f"Context: {context}"
-                    )
+                    self._drain()
+                    raise self._failure_error(result, context)
                 elif exp.action == QualityAction.QUARANTINE:
-                    if result.failed_rows is not None and len(result.failed_rows) > 0:
+                    if result.failed_rows is not None and result.rows_failed > 0:
+                        if i in preds:
+                            drop = preds[i].fill_null(False)
+                        else:
+                            drop = self._rows_expr(_collect(result.failed_rows), columns)
+                        if not lazy:
+                            drop = result.failed_mask = df.select(drop).to_series()
+                        # Drops refer to `df`, so accumulate them across expectations
+                        quarantine_drop = drop if quarantine_drop is None else quarantine_drop | drop
                         clean_df = self._quarantine_rows(
-                            df, result.failed_rows, exp, context
+                            df, result.failed_rows, quarantine_drop, exp, context
                         )
                 elif exp.action == QualityAction.WARN:
                     # Just log (caller should check results)
                     pass
 
+        # Quarantine files are complete once validate() returns
+        self._drain()
         return clean_df, self.results
 
-    def _run_expectation(self, df: pl.DataFrame, exp: Expectation) -> QualityResult:
-        """Run single expectation and return result"""
-        if exp.type == ExpectationType.NOT_NULL:
-            return self._expect_not_null(df, exp)
-        elif exp.type == ExpectationType.UNIQUE:
-            return self._expect_unique(df, exp)
-        elif exp.type == ExpectationType.IN_SET:
-            return self._expect_in_set(df, exp)
-        elif exp.type == ExpectationType.BETWEEN:
-            return self._expect_between(df, exp)
-        elif exp.type == ExpectationType.REGEX_MATCH:
-            return self._expect_regex_match(df, exp)
-        elif exp.type == ExpectationType.ROW_COUNT_BETWEEN:
-            return self._expect_row_count_between(df, exp)
-        elif exp.type == ExpectationType.COLUMN_EXISTS:
-            return self._expect_column_exists(df, exp)
-        elif exp.type == ExpectationType.CUSTOM:
-            return self._expect_custom(df, exp)
-        else:
-            raise ValueError(f"Unknown expectation type: {exp.type}")
+    def _fused_exprs(
+        self,
+        expectations: List[Expectation],
+        columns: List[str]
+    ) -> tuple[Dict[int, pl.Expr], List[pl.Expr]]:
+        """
+        Failure predicates (by expectation index) and the fused sum select.
 
-    def _expect_not_null(self, df: pl.DataFrame, exp: Expectation) -> QualityResult:
-        """Expect column values are not null"""
-        col = exp.column
-        if col not in df.columns:
-            return QualityResult(
-                expectation_name=exp.name,
-                expectation_type=exp.type,
-                passed=False,
-                rows_evaluated=0,
-                rows_failed=0,
-                failure_pct=0.0,
-                message=f"Column '{col}' not found in DataFrame"
+        Cached per (columns, expectation type/column/config) so repeated
+        batches with the same schema skip rebuilding the expressions; a
+        config edited in place yields a new key, like the _compiled check.
+        """
+        try:
+            key = (
+                tuple(columns),
+                tuple((exp.type, exp.column, _freeze(exp.config)) for exp in expectations),
             )
-
-        null_mask = df[col].is_null()
-        failed_df = df.filter(null_mask)
-        rows_failed = len(failed_df)
-        rows_evaluated = len(df)
-        failure_pct = (rows_failed / rows_evaluated * 100) if rows_evaluated > 0 else 0
-        passed = failure_pct <= exp.threshold_pct
-
-        return QualityResult(
-            expectation_name=exp.name,
-            expectation_type=exp.type,
-            passed=passed,
-            rows_evaluated=rows_evaluated,
-            rows_failed=rows_failed,
-            failure_pct=failure_pct,
-            message=f"Column '{col}' has {rows_failed} null values",
-            failed_rows=failed_df if rows_failed > 0 else None
+            hit = self._expr_cache.get(key)
+        except TypeError:
+            # Unhashable config value: build without caching
+            key, hit = None, None
+        if hit is not None:
+            self._expr_cache.move_to_end(key)
+            return hit
+
+        preds: Dict[int, pl.Expr] = {}
+        for i, exp in enumerate(expectations):
+            if exp.type in _EXPR_TYPES and exp.column in columns:
+                preds[i] = self._failure_expr(exp)
+        sums = [pred.sum().alias(f"_exp_{i}") for i, pred in preds.items()]
+
+        if key is not None:
+            self._expr_cache[key] = (preds, sums)
+            if len(self._expr_cache) > _EXPR_CACHE_SIZE:
+                self._expr_cache.popitem(last=False)
+        return preds, sums
+
+    @staticmethod
+    def _failure_error(result: QualityResult, context: Dict[str, Any]) -> ValueError:
+        """Error raised for a failed expectation with action FAIL"""
+        return ValueError(
+            f"Data quality check failed: {result}\n"
+            f"Context: {context}"
         )
 
-    def _expect_unique(self, df: pl.DataFrame, exp: Expectation) -> QualityResult:
-        """Expect column values are unique"""
-        col = exp.column
-        if col not in df.columns:
-            return QualityResult(
-                expectation_name=exp.name,
-                expectation_type=exp.type,
-                passed=False,
-                rows_evaluated=0,
-                rows_failed=0,
-                failure_pct=0.0,
-                message=f"Column '{col}' not found in DataFrame"
-            )
-
-        # Find duplicates
-        dup_counts = df.group_by(col).agg(pl.len().alias("count"))
-        duplicates = dup_counts.filter(pl.col("count") > 1)
-
-        if len(duplicates) > 0:
-            dup_values = duplicates[col].to_list()
-            failed_df = df.filter(pl.col(col).is_in(dup_values))
-            rows_failed = len(failed_df)
-        else:
-            failed_df = None
-            rows_failed = 0
-
-        rows_evaluated = len(df)
-        failure_pct = (rows_failed / rows_evaluated * 100) if rows_evaluated > 0 else 0
-        passed = failure_pct <= exp.threshold_pct
+    def _run_expectation(self, df: pl.DataFrame, exp: Expectation) -> QualityResult:
+        """Run single expectation and return result"""
+        handler = self._HANDLERS.get(exp.type)
+        if handler is None:
+            raise ValueError(f"Unknown expectation type: {exp.type}")
+        return handler(self, df, exp)
 
-        return QualityResult(
-            expectation_name=exp.name,
-            expectation_type=exp.type,
-            passed=passed,
-            rows_evaluated=rows_evaluated,
-            rows_failed=rows_failed,
-            failure_pct=failure_pct,
-            message=f"Column '{col}' has {len(duplicates)} duplicate values affecting {rows_failed} rows",
-            failed_rows=failed_df
-        )
+    @staticmethod
+    def _failure_expr(exp: Expectation) -> pl.Expr:
+        """Boolean expression that is True for rows failing a column expectation"""
+        col = pl.col(exp.column)
 
-    def _expect_in_set(self, df: pl.DataFrame, exp: Expectation) -> QualityResult:
-        """Expect column values are in allowed set"""
+        if exp.type == ExpectationType.NOT_NULL:
+            return col.is_null()
+
+        if exp.type == ExpectationType.UNIQUE:
+            # Rows whose (non-null) value occurs more than once
+            return col.count().over(exp.column) > 1
+
+        if exp.type == ExpectationType.IN_SET:
+            allowed_values = exp.config.get("values", [])
+            key = (exp.column, tuple(allowed_values))
+            if exp._compiled is None or exp._compiled[0] != key:
+                # Build the allowed-value Series once instead of per call
+                allowed = pl.Series(allowed_values)
+                expr = ~col.is_in(allowed.implode()) & col.is_not_null()
+                exp._compiled = (key, expr)
+            return exp._compiled[1]
+
+        if exp.type == ExpectationType.BETWEEN:
+            min_val = exp.config.get("min")
+            max_val = exp.config.get("max")
+            if min_val is not None and max_val is not None:
+                condition = col.is_between(pl.lit(min_val), pl.lit(max_val))
+            elif min_val is not None:
+                condition = col >= min_val
+            elif max_val is not None:
+                condition = col <= max_val
+            else:
+                # No bounds: nothing can fail
+                return pl.lit(False)
+            return ~condition & col.is_not_null()
+
+        if exp.type == ExpectationType.REGEX_MATCH:
+            pattern = exp.config.get("pattern", "")
+            key = (exp.column, pattern)
+            if exp._compiled is None or exp._compiled[0] != key:
+                expr = ~col.cast(pl.Utf8).str.contains(pattern) & col.is_not_null()
+                exp._compiled = (key, expr)
+            return exp._compiled[1]
+
+        raise ValueError(f"No failure expression for expectation type: {exp.type}")
+
+    @staticmethod
+    def _failure_message(exp: Expectation, rows_failed: int, dup_values: int = 0) -> str:
+        """Result message for a column expectation"""
         col = exp.column
-        allowed_values = exp.config.get("values", [])
-
-        if col not in df.columns:
-            return QualityResult(
-                expectation_name=exp.name,
-                expectation_type=exp.type,
-                passed=False,
-                rows_evaluated=0,
-                rows_failed=0,
-                failure_pct=0.0,
-                message=f"Column '{col}' not found in DataFrame"
+        if exp.type == ExpectationType.NOT_NULL:
+            return f"Column '{col}' has {rows_failed} null values"
+        if exp.type == ExpectationType.UNIQUE:
+            return f"Column '{col}' has {dup_values} duplicate values affecting {rows_failed} rows"
+        if exp.type == ExpectationType.IN_SET:
+            return f"Column '{col}' has {rows_failed} values not in {exp.config.get('values', [])}"
+        if exp.type == ExpectationType.BETWEEN:
+            return (
+                f"Column '{col}' has {rows_failed} values outside "
+                f"[{exp.config.get('min')}, {exp.config.get('max')}]"
             )
+        return (
+            f"Column '{col}' has {rows_failed} values not matching pattern "
+            f"'{exp.config.get('pattern', '')}'"
+        )
 
-        failed_df = df.filter(~pl.col(col).is_in(allowed_values) & pl.col(col).is_not_null())
-        rows_failed = len(failed_df)
-        rows_evaluated = len(df)
-        failure_pct = (rows_failed / rows_evaluated * 100) if rows_evaluated > 0 else 0
-        passed = failure_pct <= exp.threshold_pct
-
+    @staticmethod
+    def _missing_column_result(exp: Expectation) -> QualityResult:
+        """Failed result for an expectation whose column is absent"""
         return QualityResult(
             expectation_name=exp.name,
             expectation_type=exp.type,
-            passed=passed,
-            rows_evaluated=rows_evaluated,
-            rows_failed=rows_failed,
-            failure_pct=failure_pct,
-            message=f"Column '{col}' has {rows_failed} values not in {allowed_values}",
-            failed_rows=failed_df if rows_failed > 0 else None
+            passed=False,
+            rows_evaluated=0,
+            rows_failed=0,
+            failure_pct=0.0,
+            message=f"Column '{exp.column}' not found in DataFrame"
         )
 
-    def _expect_between(self, df: pl.DataFrame, exp: Expectation) -> QualityResult:
-        """Expect column values are between min and max"""
-        col = exp.column
-        min_val = exp.config.get("min")
-        max_val = exp.config.get("max")
-
-        if col not in df.columns:
-            return QualityResult(
-                expectation_name=exp.name,
-                expectation_type=exp.type,
-                passed=False,
-                rows_evaluated=0,
-                rows_failed=0,
-                failure_pct=0.0,
-                message=f"Column '{col}' not found in DataFrame"
-            )
+    def _expect_expr(self, df: pl.DataFrame, exp: Expectation) -> QualityResult:
+        """Run a single column expectation through its failure expression"""
+        if exp.column not in df.columns:
+            return self._missing_column_result(exp)
 
-        condition = pl.lit(True)
-        if min_val is not None:
-            condition = condition & (pl.col(col) >= min_val)
-        if max_val is not None:
-            condition = condition & (pl.col(col) <= max_val)
+        pred = self._failure_expr(exp)
+        if exp.type == ExpectationType.NOT_NULL:
+            rows_failed = df[exp.column].null_count()
+        else:
+            rows_failed = df.select(pred.sum()).item() or 0
+        return self._expr_result(df, exp, pred, rows_failed, len(df))
 
-        failed_df = df.filter(~condition & pl.col(col).is_not_null())
-        rows_failed = len(failed_df)
-        rows_evaluated = len(df)
+    def _expr_result(
+        self,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        exp: Expectation,
+        pred: pl.Expr,
+        rows_failed: int,
+        rows_evaluated: int
+    ) -> QualityResult:
+        """
+        Build the result for a column expectation from its failure count.
+        Failed rows are kept as a lazy filter over `df`; nothing is
+        materialized unless they are quarantined or the caller collects them.
+        """
         failure_pct = (rows_failed / rows_evaluated * 100) if rows_evaluated > 0 else 0
         passed = failure_pct <= exp.threshold_pct
 
-        return QualityResult(
-            expectation_name=exp.name,
-            expectation_type=exp.type,
-            passed=passed,
-            rows_evaluated=rows_evaluated,
-            rows_failed=rows_failed,
-            failure_pct=failure_pct,
-            message=f"Column '{col}' has {rows_failed} values outside [{min_val}, {max_val}]",
-            failed_rows=failed_df if rows_failed > 0 else None
-        )
+        # Distinct duplicated values, only needed for the unique message
+        dup_values = 0
+        if exp.type == ExpectationType.UNIQUE and rows_failed > 0:
+            dup_values = _collect(df.select(pl.col(exp.column).filter(pred).n_unique())).item()
 
-    def _expect_regex_match(self, df: pl.DataFrame, exp: Expectation) -> QualityResult:
-        """Expect column values match regex pattern"""
-        col = exp.column
-        pattern = exp.config.get("pattern", "")
-
-        if col not in df.columns:
-            return QualityResult(
-                expectation_name=exp.name,
-                expectation_type=exp.type,
-                passed=False,
-                rows_evaluated=0,
-                rows_failed=0,
-                failure_pct=0.0,
-                message=f"Column '{col}' not found in DataFrame"
-            )
-
-        failed_df = df.filter(
-            ~pl.col(col).cast(pl.Utf8).str.contains(pattern) & pl.col(col).is_not_null()
-        )
-        rows_failed = len(failed_df)
-        rows_evaluated = len(df)
-        failure_pct = (rows_failed / rows_evaluated * 100) if rows_evaluated > 0 else 0
-        passed = failure_pct <= exp.threshold_pct
+        failed_rows = None
+        if rows_failed > 0 and not passed:
+            failed_rows = df.lazy().filter(pred.fill_null(False))
 
         return QualityResult(
             expectation_name=exp.name,
@@ -352,15 +464,14 @@ class QualityValidator:
             rows_evaluated=rows_evaluated,
             rows_failed=rows_failed,
             failure_pct=failure_pct,
-            message=f"Column '{col}' has {rows_failed} values not matching pattern '{pattern}'",
-            failed_rows=failed_df if rows_failed > 0 else None
+            message=self._failure_message(exp, rows_failed, dup_values),
+            failed_rows=failed_rows
         )
 
-    def _expect_row_count_between(self, df: pl.DataFrame, exp: Expectation) -> QualityResult:
+    def _expect_row_count_between(self, exp: Expectation, row_count: int) -> QualityResult:
         """Expect row count is between min and max"""
         min_rows = exp.config.get("min", 0)
         max_rows = exp.config.get("max", float("inf"))
-        row_count = len(df)
 
         passed = min_rows <= row_count <= max_rows
         message = f"Row count {row_count} "
@@ -379,16 +490,16 @@ class QualityValidator:
             message=message
         )
 
-    def _expect_column_exists(self, df: pl.DataFrame, exp: Expectation) -> QualityResult:
+    def _expect_column_exists(self, exp: Expectation, columns: List[str], row_count: int) -> QualityResult:
         """Expect column exists in DataFrame"""
         col = exp.column
-        exists = col in df.columns
+        exists = col in columns
 
         return QualityResult(
             expectation_name=exp.name,
             expectation_type=exp.type,
             passed=exists,
-            rows_evaluated=len(df),
+            rows_evaluated=row_count,
             rows_failed=0,
             failure_pct=0.0,
             message=f"Column '{col}' {'exists' if exists else 'missing'}"
@@ -422,29 +533,45 @@ class QualityValidator:
             rows_failed=rows_failed,
             failure_pct=failure_pct,
             message=message,
-            failed_rows=failed_df
+            failed_rows=failed_df.lazy() if failed_df is not None else None
         )
 
+    # Expectation type -> handler(self, df, exp), used by _run_expectation
+    _HANDLERS: Dict[ExpectationType, Callable[..., QualityResult]] = {
+        **dict.fromkeys(_EXPR_TYPES, _expect_expr),
+        ExpectationType.ROW_COUNT_BETWEEN: lambda self, df, exp: self._expect_row_count_between(exp, len(df)),
+        ExpectationType.COLUMN_EXISTS: lambda self, df, exp: self._expect_column_exists(exp, df.columns, len(df)),
+        ExpectationType.CUSTOM: _expect_custom,
+    }
+
+    @staticmethod
+    def _rows_expr(failed_rows: pl.DataFrame, columns: List[str]) -> pl.Expr:
+        """Predicate for rows equal to any row of `failed_rows` (for custom checks)"""
+        failed = failed_rows.select(columns).select(pl.struct(pl.all())).to_series()
+        return pl.struct(pl.all()).is_in(failed.implode())
+
     def _quarantine_rows(
         self,
-        df: pl.DataFrame,
-        failed_rows: pl.DataFrame,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        failed_rows: pl.LazyFrame,
+        failed_mask: Union[pl.Series, pl.Expr],
         exp: Expectation,
         context: Dict[str, Any]
-    ) -> pl.DataFrame:
+    ) -> Union[pl.DataFrame, pl.LazyFrame]:
         """
         Write failed rows to quarantine and return clean DataFrame
 
         Args:
             df: Original DataFrame
             failed_rows: Rows that failed validation
+            failed_mask: Boolean mask (or predicate, for a LazyFrame) of rows to drop
             exp: Expectation that failed
             context: Run context
 
         Returns:
             Clean DataFrame (original minus failed rows)
         """
-        if self.quarantine_dir and len(failed_rows) > 0:
+        if self.quarantine_dir:
             self.quarantine_dir.mkdir(parents=True, exist_ok=True)
 
             # Add metadata columns
@@ -459,22 +586,15 @@ class QualityValidator:
             import datetime
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             quarantine_file = self.quarantine_dir / f"{exp.name}_{timestamp}.parquet"
-            quarantine_df.write_parquet(quarantine_file)
-
-        # Return clean rows (anti-join)
-        # Create unique identifier for anti-join
-        if len(df.columns) > 0:
-            # Use row index for anti-join
-            df_with_idx = df.with_row_count("_row_idx")
-            failed_with_idx = failed_rows.with_row_count("_row_idx")
-            clean_df = df_with_idx.join(
-                failed_with_idx.select("_row_idx"),
-                on="_row_idx",
-                how="anti"
-            ).drop("_row_idx")
-            return clean_df
-
-        return df
+            self._pending.append(self._io.submit(self._write_parquet, quarantine_df, quarantine_file))
+
+        # Return clean rows
+        return df.filter(~failed_mask)
+
+    @staticmethod
+    def _write_parquet(frame: pl.LazyFrame, path: Path) -> None:
+        """Collect quarantined rows and write them (runs on the writer thread)"""
+        _collect(frame).write_parquet(path)
 
     def get_summary(self) -> Dict[str, Any]:
         """Get summary of validation results"""
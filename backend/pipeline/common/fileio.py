@@ -1,9 +1,16 @@
 from __future__ import annotations
+import fnmatch
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Mapping, Optional, List
+from typing import Callable, Dict, Iterable, Iterator, Mapping, Optional, List
 
 _GLOB_META = set("*?[]")
 
+# Pattern separators (CR, LF, comma) all become ';'; BOMs are dropped
+_SPLIT_TT = str.maketrans({"\r": ";", "\n": ";", ",": ";", "\ufeff": None})
+
 def _split_patterns(files: Optional[object]) -> List[str]:
     if files is None:
         return []
@@ -15,8 +22,8 @@ def _split_patterns(files: Optional[object]) -> List[str]:
     if not s:
         return []
     parts: List[str] = []
-    for chunk in s.replace("\r\n", "\n").replace("\r", "\n").replace("\n", ";").replace(",", ";").split(";"):
-        c = chunk.replace("\ufeff", "").strip().strip('"').strip("'")
+    for chunk in s.translate(_SPLIT_TT).split(";"):
+        c = chunk.strip().strip('"').strip("'")
         if c:
             parts.append(c)
     return parts
@@ -34,6 +41,55 @@ def _normalize_name(s: str) -> str:
          .strip("'")
     )
 
+def _scan_names(base: Path) -> Dict[str, str]:
+    """Map normalized, casefolded file names in `base` to their paths (first wins)."""
+    names: Dict[str, str] = {}
+    try:
+        with os.scandir(base) as it:
+            for entry in it:
+                if entry.is_file():
+                    names.setdefault(_normalize_name(entry.name).casefold(), entry.path)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return names
+
+@lru_cache(maxsize=256)
+def _name_matcher(pattern: str) -> Callable[[str], Optional[re.Match]]:
+    """Compiled matcher for a file-name glob (case-insensitive on Windows, like pathlib)."""
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile(fnmatch.translate(pattern), flags).match
+
+def _glob_files(base: Path, pattern: str, recursive: bool) -> Iterator[Path]:
+    """
+    Files under `base` matching `pattern`, like base.glob / base.rglob.
+
+    Name-only patterns are matched with os.scandir, reusing each DirEntry's
+    cached type info instead of stat-ing every path; patterns containing a
+    directory part fall back to pathlib.
+    """
+    if "/" in pattern or os.sep in pattern:
+        globber = base.rglob if recursive else base.glob
+        for m in globber(pattern):
+            if m.is_file():
+                yield m
+        return
+
+    match = _name_matcher(pattern)
+
+    def walk(d: str) -> Iterator[Path]:
+        try:
+            with os.scandir(d) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            return
+        for entry in entries:
+            if entry.is_file() and match(entry.name):
+                yield Path(entry.path)
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                yield from walk(entry.path)
+
+    yield from walk(str(base))
+
 def iter_source_files(
     base_dir: Path,
     source: Mapping[str, object],
@@ -49,7 +105,7 @@ def iter_source_files(
       - Absolute paths in 'files' → yield directly if exist.
       - Literal filenames (no wildcards) → join with 'path'. If not found, try a
         case-insensitive/normalized match inside the directory.
-      - Glob patterns → use glob/rglob.
+      - Glob patterns → match file names while scanning (recursing if requested).
       - No 'files':
           * if 'path' is a file → yield it
           * else treat 'path' as dir and use default_glob
@@ -62,6 +118,8 @@ def iter_source_files(
 
     # Case 1: explicit files/patterns
     if patterns:
+        # Directory listing for the literal-name fallback, scanned at most once
+        name_map: Optional[Dict[str, str]] = None
         for pat in patterns:
             pat = _normalize_name(pat)
             p = Path(pat)
@@ -79,26 +137,16 @@ def iter_source_files(
                     yield cand
                     continue
 
-                # Fallback: try case-insensitive / normalized scan of the directory
-                if base.is_dir():
-                    try:
-                        want = _normalize_name(pat).casefold()
-                        for child in base.iterdir():
-                            if not child.is_file():
-                                continue
-                            name_norm = _normalize_name(child.name).casefold()
-                            if name_norm == want:
-                                yield child.resolve()
-                                break  # found the match
-                    except FileNotFoundError:
-                        pass
+                # Fallback: try case-insensitive / normalized match in the directory
+                if name_map is None:
+                    name_map = _scan_names(base)
+                hit = name_map.get(_normalize_name(pat).casefold())
+                if hit is not None:
+                    yield Path(hit).resolve()
                 continue
 
             # C) glob pattern under base
-            globber = base.rglob if recursive else base.glob
-            for m in globber(pat):
-                if m.is_file():
-                    yield m
+            yield from _glob_files(base, pat, recursive)
         return
 
     # Case 2: no 'files' key
@@ -106,7 +154,4 @@ def iter_source_files(
         yield base
         return
 
-    globber = base.rglob if recursive else base.glob
-    for m in globber(default_glob):
-        if m.is_file():
-            yield m
+    yield from _glob_files(base, default_glob, recursive)
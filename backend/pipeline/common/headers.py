@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
+from functools import lru_cache
 from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from pipeline.common.utils import resolve_placeholders
@@ -14,41 +16,65 @@ __all__ = [
     "build_alias_map_norm",
 ]
 
+@lru_cache(maxsize=1024, typed=True)
+def _compile_ci(pat: str) -> "re.Pattern[str]":
+    """Case-insensitive compile, shared across files resolving the same alias spec."""
+    return re.compile(pat, re.IGNORECASE)
+
 def resolve_alias_entry(alias_entry: Any, variables: Mapping[str, str]) -> Any:
     """Resolve placeholders in alias entries using ENV ONLY."""
     if isinstance(alias_entry, dict) and "regex" in alias_entry:
         pat = resolve_placeholders(alias_entry["regex"], variables)
-        return {"regex": re.compile(pat, re.IGNORECASE)}
+        return {"regex": _compile_ci(pat)}
     elif isinstance(alias_entry, str):
         return resolve_placeholders(alias_entry, variables)
     else:
         return alias_entry
 
+@lru_cache(maxsize=8192, typed=True)
 def norm_header(s: str) -> str:
-    s = str(s or "").strip()
-    s = re.sub(r"\s+", " ", s).rstrip(".")
+    # split()/join collapses whitespace runs like re.sub(r"\s+", " ") but in C
+    s = " ".join(str(s or "").split()).rstrip(".")
     return s.lower()
 
 def make_unique_headers(headers: List[str]) -> List[str]:
+    norms = list(map(norm_header, headers))
+    counts = Counter(norms)
+    if len(counts) == len(norms):
+        return list(headers)  # common case: nothing collides
     seen: Dict[str, int] = {}
     out: List[str] = []
-    for h in headers:
-        k = norm_header(h)
+    for h, k in zip(headers, norms):
+        if counts[k] == 1:
+            out.append(h)
+            continue
         cnt = seen.get(k, 0)
         out.append(h if cnt == 0 else f"{h}_{cnt}")
         seen[k] = cnt + 1
     return out
 
+def _is_regex_entry(alias_entry: Any) -> bool:
+    return isinstance(alias_entry, dict) and "regex" in alias_entry and hasattr(alias_entry["regex"], "fullmatch")
+
+def _prepare_aliases(aliases: List[Any]) -> List[Any]:
+    """Normalize plain aliases once; regex entries are kept as-is."""
+    return [a if _is_regex_entry(a) else norm_header(str(a)) for a in aliases]
+
+def _match_prepared(header_set_norm: Set[str], alias_entry: Any) -> Tuple[bool, Optional[str]]:
+    """match_alias for entries already passed through _prepare_aliases."""
+    if isinstance(alias_entry, str):
+        return (alias_entry in header_set_norm, alias_entry if alias_entry in header_set_norm else None)
+    pat = alias_entry["regex"]
+    for h in header_set_norm:
+        if pat.fullmatch(h):
+            return True, h
+    return False, None
+
 def match_alias(header_set_norm: Set[str], alias_entry: Any) -> Tuple[bool, Optional[str]]:
-    if isinstance(alias_entry, dict) and "regex" in alias_entry and hasattr(alias_entry["regex"], "fullmatch"):
-        pat = alias_entry["regex"]
-        for h in header_set_norm:
-            if pat.fullmatch(h):
-                return True, h
-        return False, None
+    if _is_regex_entry(alias_entry):
+        return _match_prepared(header_set_norm, alias_entry)
     # ensure string input for norm_header
-    a = norm_header(str(alias_entry))
-    return (a in header_set_norm, a if a in header_set_norm else None)
+    return _match_prepared(header_set_norm, norm_header(str(alias_entry)))
 
 def has_all_required_columns_norm(header_set_norm: Set[str], column_spec: List[Dict[str, Any]]) -> Tuple[bool, List[Any]]:
     missing: List[Any] = []
@@ -57,12 +83,14 @@ def has_all_required_columns_norm(header_set_norm: Set[str], column_spec: List[D
         if not isinstance(aliases, list):
             aliases = [aliases]
         is_required = bool(col.get("required")) or (col.get("optional") is False)
-        ok = False
-        for a in aliases:
-            matched, _ = match_alias(header_set_norm, a)
-            if matched:
-                ok = True
-                break
+        prepared = _prepare_aliases(aliases)
+        # Plain aliases: one set probe each; only regex aliases scan the headers
+        ok = not header_set_norm.isdisjoint(a for a in prepared if isinstance(a, str))
+        if not ok:
+            ok = any(
+                _match_prepared(header_set_norm, a)[0]
+                for a in prepared if not isinstance(a, str)
+            )
         if not ok and is_required:
             missing.append(aliases)
     return (len(missing) == 0, missing)
@@ -95,8 +123,8 @@ def build_alias_map_norm(
         canonical = norm_header(output_name)
 
         found_actual: Optional[str] = None
-        for a in aliases:
-            matched, matched_norm = match_alias(header_set_norm, a)
+        for a in _prepare_aliases(aliases):
+            matched, matched_norm = _match_prepared(header_set_norm, a)
             if matched:
                 if matched_norm is not None:
                     found_actual = norm_to_actual[matched_norm]
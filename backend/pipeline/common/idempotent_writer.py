@@ -5,11 +5,11 @@ Handles retries, duplicates, and ensures exactly-once semantics
 """
 from __future__ import annotations
 
-import hashlib
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import polars as pl
 import duckdb
@@ -31,16 +31,45 @@ class MergeStrategy(str, Enum):
     DELETE_INSERT = "delete_insert"  # DELETE then INSERT (for complex updates)
 
 
+class HashAlgo(str, Enum):
+    """Row checksum algorithm for INCREMENTAL mode"""
+    MD5 = "md5"                 # 32-char hex VARCHAR, stable across versions
+    XXHASH = "xxhash"           # Polars row hash as UBIGINT; faster, but values may change between Polars releases
+
+
 @dataclass
 class WriteConfig:
     """Configuration for idempotent write operation"""
     mode: WriteMode = WriteMode.APPEND
     primary_keys: List[str] = field(default_factory=list)  # Keys for MERGE/dedup
     merge_strategy: MergeStrategy = MergeStrategy.UPDATE
+    update_columns: Optional[List[str]] = None  # Columns MERGE may update (default: all non-key columns)
     dedupe_within_batch: bool = True  # Remove duplicates within new data
     create_table_if_missing: bool = True
     partition_by: Optional[List[str]] = None  # For incremental partitioning
     checksum_column: str = "_row_hash"  # Column name for row checksums
+    hash_algo: HashAlgo = HashAlgo.MD5  # Checksum algorithm for INCREMENTAL mode
+    chunk_rows: int = 100_000  # Rows registered per statement; larger frames are written in slices
+    create_unique_key: bool = False  # MERGE (update/ignore): add a unique index on primary_keys when creating the table
+
+
+# Stand-in for null values in row-hash keys (a NULL key would hash to NULL)
+_NULL_MARKER = "\\N"
+
+# Catalog-function filter for one table; parameters from _split_table_name()
+_CATALOG_MATCH = """
+    lower(table_name) = lower(?)
+    AND lower(schema_name) = lower(coalesce(?, current_schema()))
+    AND lower(database_name) = lower(coalesce(?, current_database()))
+"""
+
+
+def _split_table_name(table_name: str) -> List[Optional[str]]:
+    """[table, schema, database] of a (possibly qualified) name; missing parts are None"""
+    *qualifiers, table = table_name.split(".")
+    schema = qualifiers[-1] if qualifiers else None
+    database = qualifiers[-2] if len(qualifiers) > 1 else None
+    return [table, schema, database]
 
 
 class IdempotentWriter:
@@ -72,7 +101,10 @@ class IdempotentWriter:
     def __init__(self, db_path: Union[Path, str, duckdb.DuckDBPyConnection]):
         """
         Args:
-            db_path: Path to DuckDB database file, or existing connection
+            db_path: Path to DuckDB database file, or existing connection.
+                A connection opened from a path is closed on exit, releasing
+                the file lock; for repeated writes keep one writer open (or
+                pass a connection) instead of reconnecting per write.
         """
         if isinstance(db_path, duckdb.DuckDBPyConnection):
             self.conn = db_path
@@ -81,6 +113,9 @@ class IdempotentWriter:
             self.db_path = Path(db_path)
             self.conn = duckdb.connect(str(self.db_path))
             self.owns_connection = True
+        # Table name -> column names for tables seen to exist this session
+        self._table_cache: Dict[str, Set[str]] = {}
+        self._in_transaction = False
 
     def __enter__(self):
         return self
@@ -115,16 +150,10 @@ class IdempotentWriter:
             df = self._dedupe_dataframe(df, config.primary_keys)
 
         # Route to appropriate write method
-        if config.mode == WriteMode.APPEND:
-            return self._write_append(df, full_table, config)
-        elif config.mode == WriteMode.OVERWRITE:
-            return self._write_overwrite(df, full_table, config)
-        elif config.mode in (WriteMode.MERGE, WriteMode.UPSERT):
-            return self._write_merge(df, full_table, config)
-        elif config.mode == WriteMode.INCREMENTAL:
-            return self._write_incremental(df, full_table, config)
-        else:
+        write_method = self._DISPATCH.get(config.mode)
+        if write_method is None:
             raise ValueError(f"Unknown write mode: {config.mode}")
+        return write_method(self, df, full_table, config)
 
     def _write_append(
         self, df: pl.DataFrame, table_name: str, config: WriteConfig
@@ -133,10 +162,7 @@ class IdempotentWriter:
         if not self._table_exists(table_name) and config.create_table_if_missing:
             self._create_table_from_dataframe(df, table_name)
 
-        # Register DataFrame and insert
-        self.conn.register("_temp_df", df)
-        result = self.conn.execute(f"INSERT INTO {table_name} SELECT * FROM _temp_df")
-        self.conn.unregister("_temp_df")
+        self._insert_frame(df, table_name, config.chunk_rows)
 
         return {
             "mode": "append",
@@ -149,14 +175,14 @@ class IdempotentWriter:
         self, df: pl.DataFrame, table_name: str, config: WriteConfig
     ) -> Dict[str, Any]:
         """Truncate and write"""
-        if self._table_exists(table_name):
-            self.conn.execute(f"DELETE FROM {table_name}")
-        elif config.create_table_if_missing:
+        exists = self._table_exists(table_name)
+        if not exists and config.create_table_if_missing:
             self._create_table_from_dataframe(df, table_name)
 
-        self.conn.register("_temp_df", df)
-        self.conn.execute(f"INSERT INTO {table_name} SELECT * FROM _temp_df")
-        self.conn.unregister("_temp_df")
+        with self._transaction():
+            if exists:
+                self.conn.execute(f"DELETE FROM {table_name}")
+            self._insert_frame(df, table_name, config.chunk_rows)
 
         return {
             "mode": "overwrite",
@@ -179,77 +205,104 @@ class IdempotentWriter:
         # Create table if missing
         if not self._table_exists(table_name):
             if config.create_table_if_missing:
-                self._create_table_from_dataframe(df, table_name)
+                self._create_table_from_dataframe(df, table_name, config)
                 return self._write_append(df, table_name, config)
             else:
                 raise ValueError(f"Table {table_name} does not exist")
 
-        # Register new data
-        self.conn.register("_new_data", df)
+        # Key-ordered input keeps index probes on the target sequential
+        df = df.sort(config.primary_keys, maintain_order=True)
 
         # Build MERGE statement
         join_conditions = " AND ".join(
             f"target.{key} = source.{key}" for key in config.primary_keys
         )
+        # Columns to UPDATE: all non-key columns, or the configured subset
+        update_cols = [
+            col for col in df.columns
+            if col not in config.primary_keys
+            and (config.update_columns is None or col in config.update_columns)
+        ]
+        # ON CONFLICT needs a unique constraint/index on the keys. The writer
+        # never adds one to an existing table (that would change its schema
+        # and reject later duplicate APPENDs); without one, MERGE falls back
+        # to UPDATE/anti-join statements
+        upsert = (
+            config.merge_strategy in (MergeStrategy.UPDATE, MergeStrategy.IGNORE)
+            and self._has_unique_key(table_name, config.primary_keys)
+        )
+
+        # Oversized batches are merged slice by slice, committed once
+        rows_inserted = rows_updated = 0
+        with self._transaction():
+            for chunk in df.iter_slices(config.chunk_rows):
+                self._register("_new_data", chunk)
+                inserted, updated = self._merge_chunk(
+                    chunk, table_name, config, join_conditions, update_cols, upsert
+                )
+                self.conn.unregister("_new_data")
+                rows_inserted += inserted
+                rows_updated += updated
+
+        return {
+            "mode": "merge",
+            "rows_inserted": rows_inserted,
+            "rows_updated": rows_updated,
+            "rows_deleted": 0
+        }
+
+    def _merge_chunk(
+        self,
+        df: pl.DataFrame,
+        table_name: str,
+        config: WriteConfig,
+        join_conditions: str,
+        update_cols: List[str],
+        upsert: bool
+    ) -> Tuple[int, int]:
+        """
+        Merge the batch registered as _new_data into the table
 
+        Returns:
+            (rows_inserted, rows_updated)
+        """
         if config.merge_strategy == MergeStrategy.UPDATE:
-            # Get all columns except primary keys for UPDATE
-            all_cols = df.columns
-            update_cols = [col for col in all_cols if col not in config.primary_keys]
+            if not upsert:
+                # No unique key to conflict on: UPDATE, then INSERT
+                return self._update_then_insert(table_name, join_conditions, update_cols)
 
+            # Single pass: new keys are inserted, matched keys updated in place
             if update_cols:
-                update_clause = ", ".join(f"{col} = source.{col}" for col in update_cols)
-                matched_action = f"WHEN MATCHED THEN UPDATE SET {update_clause}"
+                update_clause = ", ".join(f"{col} = excluded.{col}" for col in update_cols)
+                # Leave rows whose values are unchanged untouched (no row rewrite)
+                conflict_action = (
+                    f"DO UPDATE SET {update_clause} "
+                    f"WHERE {self._changed_condition(update_cols, 'excluded')}"
+                )
             else:
                 # No columns to update, just ignore matches
-                matched_action = ""
+                conflict_action = "DO NOTHING"
 
-            insert_cols = ", ".join(all_cols)
-            insert_vals = ", ".join(f"source.{col}" for col in all_cols)
-
-            merge_sql = f"""
-                INSERT INTO {table_name}
-                SELECT * FROM _new_data source
-                WHERE NOT EXISTS (
-                    SELECT 1 FROM {table_name} target
-                    WHERE {join_conditions}
-                )
+            upsert_sql = f"""
+                INSERT INTO {table_name} AS target
+                SELECT * FROM _new_data
+                ON CONFLICT ({", ".join(config.primary_keys)}) {conflict_action}
             """
+            rows_before = self._count_rows(table_name)
+            rows_affected = self.conn.execute(upsert_sql).fetchone()[0]
+            rows_inserted = self._count_rows(table_name) - rows_before
+            return rows_inserted, rows_affected - rows_inserted
 
-            # First, update existing rows
-            if update_cols:
-                update_sql = f"""
-                    UPDATE {table_name} AS target
-                    SET {update_clause}
-                    FROM _new_data AS source
-                    WHERE {join_conditions}
-                """
-                rows_updated = self.conn.execute(update_sql).fetchone()
-                if rows_updated and len(rows_updated) > 0:
-                    rows_updated = rows_updated[0] if isinstance(rows_updated[0], int) else 0
-                else:
-                    rows_updated = 0
-            else:
-                rows_updated = 0
-
-            # Then, insert new rows
-            rows_inserted = self.conn.execute(merge_sql).fetchone()
-            if rows_inserted and len(rows_inserted) > 0:
-                rows_inserted = rows_inserted[0] if isinstance(rows_inserted[0], int) else len(df)
-            else:
-                # Count manually
-                count_sql = f"""
-                    SELECT COUNT(*) FROM _new_data source
-                    WHERE NOT EXISTS (
-                        SELECT 1 FROM {table_name} target
-                        WHERE {join_conditions}
-                    )
+        if config.merge_strategy == MergeStrategy.IGNORE:
+            # Only insert new rows, ignore existing
+            if upsert:
+                merge_sql = f"""
+                    INSERT INTO {table_name}
+                    SELECT * FROM _new_data
+                    ON CONFLICT ({", ".join(config.primary_keys)}) DO NOTHING
                 """
-                rows_inserted = self.conn.execute(count_sql).fetchone()[0]
+                return self.conn.execute(merge_sql).fetchone()[0], 0
 
-        elif config.merge_strategy == MergeStrategy.IGNORE:
-            # Only insert new rows, ignore existing
-            insert_cols = ", ".join(df.columns)
             merge_sql = f"""
                 INSERT INTO {table_name}
                 SELECT * FROM _new_data source
@@ -258,33 +311,51 @@ class IdempotentWriter:
                     WHERE {join_conditions}
                 )
             """
-            self.conn.execute(merge_sql)
-            rows_inserted = len(df)  # Approximate
-            rows_updated = 0
-
-        elif config.merge_strategy == MergeStrategy.DELETE_INSERT:
-            # Delete matching rows, then insert all new rows
-            delete_sql = f"""
-                DELETE FROM {table_name}
-                WHERE ({", ".join(config.primary_keys)}) IN (
-                    SELECT {", ".join(config.primary_keys)} FROM _new_data
-                )
+            # The INSERT reports how many rows it actually wrote
+            return self.conn.execute(merge_sql).fetchone()[0], 0
+
+        # DELETE_INSERT: delete matching rows (hash semi-join), then insert all
+        # new rows; the caller's transaction keeps readers from seeing keys missing
+        delete_sql = f"""
+            DELETE FROM {table_name} AS target
+            USING _new_data AS source
+            WHERE {join_conditions}
+        """
+        self.conn.execute(delete_sql)
+        self.conn.execute(f"INSERT INTO {table_name} SELECT * FROM _new_data")
+        return len(df), 0
+
+    def _update_then_insert(
+        self, table_name: str, join_conditions: str, update_cols: List[str]
+    ) -> Tuple[int, int]:
+        """Two-statement MERGE for tables without a unique index on the keys"""
+        rows_updated = 0
+        if update_cols:
+            update_clause = ", ".join(f"{col} = source.{col}" for col in update_cols)
+            update_sql = f"""
+                UPDATE {table_name} AS target
+                SET {update_clause}
+                FROM _new_data AS source
+                WHERE {join_conditions}
+                  AND ({self._changed_condition(update_cols, "source")})
             """
-            self.conn.execute(delete_sql)
-
-            insert_sql = f"INSERT INTO {table_name} SELECT * FROM _new_data"
-            self.conn.execute(insert_sql)
-            rows_inserted = len(df)
-            rows_updated = 0
+            rows_updated = self.conn.execute(update_sql).fetchone()[0]
 
-        self.conn.unregister("_new_data")
+        insert_sql = f"""
+            INSERT INTO {table_name}
+            SELECT * FROM _new_data source
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {table_name} target
+                WHERE {join_conditions}
+            )
+        """
+        rows_inserted = self.conn.execute(insert_sql).fetchone()[0]
+        return rows_inserted, rows_updated
 
-        return {
-            "mode": "merge",
-            "rows_inserted": rows_inserted,
-            "rows_updated": rows_updated,
-            "rows_deleted": 0
-        }
+    @staticmethod
+    def _changed_condition(columns: List[str], source: str) -> str:
+        """SQL predicate: any of `columns` differs between target and `source`"""
+        return " OR ".join(f"target.{col} IS DISTINCT FROM {source}.{col}" for col in columns)
 
     def _write_incremental(
         self, df: pl.DataFrame, table_name: str, config: WriteConfig
@@ -297,11 +368,9 @@ class IdempotentWriter:
         if not self._table_exists(table_name):
             if config.create_table_if_missing:
                 # Add checksum column
-                df_with_hash = self._add_row_hash(df, config.checksum_column)
+                df_with_hash = self._add_row_hash(df, config.checksum_column, config.hash_algo)
                 self._create_table_from_dataframe(df_with_hash, table_name)
-                self.conn.register("_temp_df", df_with_hash)
-                self.conn.execute(f"INSERT INTO {table_name} SELECT * FROM _temp_df")
-                self.conn.unregister("_temp_df")
+                self._insert_frame(df_with_hash, table_name, config.chunk_rows)
                 return {
                     "mode": "incremental",
                     "rows_inserted": len(df),
@@ -312,49 +381,44 @@ class IdempotentWriter:
                 raise ValueError(f"Table {table_name} does not exist")
 
         # Add hash to new data
-        df_with_hash = self._add_row_hash(df, config.checksum_column)
+        df_with_hash = self._add_row_hash(df, config.checksum_column, config.hash_algo)
+        # Checksum-ordered input keeps probes against the target sequential
+        df_with_hash = df_with_hash.sort(config.checksum_column, maintain_order=True)
 
         # Find rows not already in table
-        self.conn.register("_new_data", df_with_hash)
+        self._register("_new_data", df_with_hash)
 
         # Check if checksum column exists in target
-        existing_cols = self.conn.execute(
-            f"SELECT column_name FROM information_schema.columns WHERE table_name = '{table_name}'"
-        ).fetchall()
-        existing_col_names = [col[0] for col in existing_cols]
+        existing_col_names = self._table_columns(table_name)
 
         if config.checksum_column not in existing_col_names:
-            # Add checksum column to existing table
-            self.conn.execute(f"ALTER TABLE {table_name} ADD COLUMN {config.checksum_column} VARCHAR")
-            # Compute hashes for existing rows
-            update_sql = f"""
-                UPDATE {table_name}
-                SET {config.checksum_column} = md5(CAST(ROW(*) AS VARCHAR))
-            """
-            self.conn.execute(update_sql)
+            # Add checksum column to existing table. Existing rows keep a NULL
+            # checksum rather than a full-table UPDATE; they are matched by key below
+            checksum_type = "UBIGINT" if config.hash_algo == HashAlgo.XXHASH else "VARCHAR"
+            self.conn.execute(f"ALTER TABLE {table_name} ADD COLUMN {config.checksum_column} {checksum_type}")
+            existing_col_names.add(config.checksum_column)
+
+        # Rows without a checksum (present before the column was added)
+        # are compared on the primary keys, or on every column if none are set
+        match_cols = config.primary_keys or df.columns
+        legacy_match = " AND ".join(
+            f"source.{col} IS NOT DISTINCT FROM legacy.{col}" for col in match_cols
+        )
 
-        # Insert only new rows (hash not in existing table)
+        # Insert only new rows (hash not in existing table); hash anti-joins,
+        # and the INSERT's own row count replaces a second counting pass
         insert_sql = f"""
             INSERT INTO {table_name}
-            SELECT * FROM _new_data
-            WHERE {config.checksum_column} NOT IN (
-                SELECT {config.checksum_column} FROM {table_name}
-            )
-        """
-        result = self.conn.execute(insert_sql)
-        self.conn.unregister("_new_data")
-
-        # Count inserted
-        count_sql = f"""
-            SELECT COUNT(*) FROM (
-                SELECT * FROM _new_data
-                WHERE {config.checksum_column} NOT IN (
-                    SELECT {config.checksum_column} FROM {table_name}
-                )
-            )
+            SELECT source.* FROM _new_data source
+            ANTI JOIN {table_name} target
+                ON source.{config.checksum_column} = target.{config.checksum_column}
+            ANTI JOIN (
+                SELECT {", ".join(match_cols)} FROM {table_name}
+                WHERE {config.checksum_column} IS NULL
+            ) legacy
+                ON {legacy_match}
         """
-        self.conn.register("_new_data", df_with_hash)
-        rows_inserted = self.conn.execute(count_sql).fetchone()[0]
+        rows_inserted = self.conn.execute(insert_sql).fetchone()[0]
         self.conn.unregister("_new_data")
 
         return {
@@ -364,33 +428,161 @@ class IdempotentWriter:
             "rows_deleted": 0
         }
 
+    # Write mode -> method(self, df, table_name, config), used by write()
+    _DISPATCH: Dict[WriteMode, Callable[..., Dict[str, Any]]] = {
+        WriteMode.APPEND: _write_append,
+        WriteMode.OVERWRITE: _write_overwrite,
+        WriteMode.MERGE: _write_merge,
+        WriteMode.UPSERT: _write_merge,
+        WriteMode.INCREMENTAL: _write_incremental,
+    }
+
     def _dedupe_dataframe(self, df: pl.DataFrame, keys: List[str]) -> pl.DataFrame:
         """Remove duplicates within DataFrame based on keys"""
         return df.unique(subset=keys, keep="last")
 
-    def _add_row_hash(self, df: pl.DataFrame, hash_column: str) -> pl.DataFrame:
+    def _add_row_hash(
+        self, df: pl.DataFrame, hash_column: str, algo: HashAlgo = HashAlgo.MD5
+    ) -> pl.DataFrame:
         """Add row hash column for deduplication"""
-        # Compute hash of all columns
-        hash_expr = pl.concat_str([pl.col(c).cast(pl.Utf8) for c in df.columns], separator="|")
-        return df.with_columns(
-            hash_expr.map_elements(
-                lambda x: hashlib.md5(x.encode()).hexdigest(), return_dtype=pl.Utf8
-            ).alias(hash_column)
+        # Nulls get a marker so rows containing them still hash (to a non-NULL value)
+        key_expr = pl.concat_str(
+            [pl.col(c).cast(pl.Utf8).fill_null(_NULL_MARKER) for c in df.columns], separator="|"
         )
+        if algo == HashAlgo.XXHASH:
+            return df.with_columns(key_expr.hash().alias(hash_column))
+
+        # Polars builds the row key (unchanged format, so stored hashes stay
+        # comparable); DuckDB's native md5 hashes it in one vectorized pass
+        keys = df.select(key_expr.alias("_key"))
+        self._register("_hash_src", keys)
+        hashes = self.conn.execute("SELECT md5(_key) AS _hash FROM _hash_src").pl().to_series()
+        self.conn.unregister("_hash_src")
+        return df.with_columns(hashes.alias(hash_column))
 
     def _table_exists(self, table_name: str) -> bool:
         """Check if table exists"""
+        return self._table_columns(table_name) is not None
+
+    def _table_columns(self, table_name: str) -> Optional[Set[str]]:
+        """
+        Column names of a table or view, or None if it doesn't exist
+
+        Reads the catalog only (no table scan); hits are cached per writer.
+        """
+        columns = self._table_cache.get(table_name)
+        if columns is None:
+            rows = self.conn.execute(
+                f"SELECT column_name FROM duckdb_columns() WHERE {_CATALOG_MATCH}",
+                _split_table_name(table_name),
+            ).fetchall()
+            if not rows:
+                return None
+            columns = self._table_cache[table_name] = {row[0] for row in rows}
+        return columns
+
+    def _has_unique_key(self, table_name: str, keys: List[str]) -> bool:
+        """Whether a PRIMARY KEY/UNIQUE constraint or unique index covers exactly `keys`"""
+        params = _split_table_name(table_name)
+        candidates = [
+            row[0] for row in self.conn.execute(
+                f"""
+                SELECT constraint_column_names FROM duckdb_constraints()
+                WHERE constraint_type IN ('PRIMARY KEY', 'UNIQUE') AND {_CATALOG_MATCH}
+                """,
+                params,
+            ).fetchall()
+        ]
+        # Index key expressions come back as text, e.g. '[id, "Key"]'
+        candidates += [
+            [expr.strip().strip('"') for expr in row[0].strip("[]").split(",")]
+            for row in self.conn.execute(
+                f"SELECT expressions FROM duckdb_indexes() WHERE is_unique AND {_CATALOG_MATCH}",
+                params,
+            ).fetchall()
+        ]
+        wanted = {key.lower() for key in keys}
+        return any({col.lower() for col in cols} == wanted for cols in candidates)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """
+        Run the block in one transaction
+
+        Joins the enclosing one if already open: the writer's own, or one
+        the caller started on a connection it passed in (which the caller
+        then commits or rolls back).
+        """
+        if self._in_transaction or (not self.owns_connection and self._caller_transaction_open()):
+            yield
+            return
+        self.conn.begin()
+        self._in_transaction = True
         try:
-            self.conn.execute(f"SELECT 1 FROM {table_name} LIMIT 1")
-            return True
-        except:
-            return False
-
-    def _create_table_from_dataframe(self, df: pl.DataFrame, table_name: str):
-        """Create table with schema inferred from DataFrame"""
-        self.conn.register("_temp_schema", df.head(0))
+            yield
+        except Exception:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._in_transaction = False
+
+    def _caller_transaction_open(self) -> bool:
+        """
+        Whether the passed-in connection is inside an explicit transaction
+
+        Autocommit gives every statement a new transaction id; inside
+        BEGIN ... COMMIT it stays the same. (A failed BEGIN can't be used as
+        the probe: it aborts the caller's transaction.)
+        """
+        txid = "SELECT txid_current()"
+        return self.conn.execute(txid).fetchone()[0] == self.conn.execute(txid).fetchone()[0]
+
+    def _insert_frame(self, df: pl.DataFrame, table_name: str, chunk_rows: int) -> None:
+        """Append all of `df`, chunk_rows at a time, in one transaction"""
+        with self._transaction():
+            for chunk in df.iter_slices(chunk_rows):
+                # Arrow relation straight into the table: no view to register,
+                # no SQL text to parse
+                self.conn.from_arrow(chunk.to_arrow()).insert_into(table_name)
+
+    def _register(self, name: str, df: pl.DataFrame) -> None:
+        """Expose `df` to SQL as `name` via Arrow (zero-copy for most dtypes)"""
+        self.conn.register(name, df.to_arrow())
+
+    def _count_rows(self, table_name: str) -> int:
+        """Current row count of a table"""
+        return self.conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+
+    def _create_table_from_dataframe(
+        self, df: pl.DataFrame, table_name: str, config: Optional[WriteConfig] = None
+    ):
+        """
+        Create table with schema inferred from DataFrame
+
+        With create_unique_key, MERGE tables (update/ignore strategies) get a
+        unique index on the keys while still empty, so later merges can use
+        ON CONFLICT. It also makes duplicate keys fail on any later insert,
+        which is why it is opt-in.
+        """
+        self._register("_temp_schema", df.head(0))
         self.conn.execute(f"CREATE TABLE {table_name} AS SELECT * FROM _temp_schema")
         self.conn.unregister("_temp_schema")
+        self._table_cache[table_name] = set(df.columns)
+
+        if (
+            config is not None
+            and config.create_unique_key
+            and config.mode in (WriteMode.MERGE, WriteMode.UPSERT)
+            and config.merge_strategy in (MergeStrategy.UPDATE, MergeStrategy.IGNORE)
+            and config.primary_keys
+            and config.dedupe_within_batch
+        ):
+            index_name = f"{table_name.split('.')[-1]}_{'_'.join(config.primary_keys)}_pk_idx"
+            self.conn.execute(
+                f"CREATE UNIQUE INDEX {index_name} ON {table_name} ({', '.join(config.primary_keys)})"
+            )
 
 
 def write_idempotent(
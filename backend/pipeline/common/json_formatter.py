@@ -15,10 +15,13 @@ Output format: One JSON object per line (JSON-Lines / NDJSON)
 """
 from __future__ import annotations
 
+import atexit
 import json
 import sys
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional
 from enum import Enum
 
 
@@ -32,6 +35,10 @@ class JSONLogLevel(str, Enum):
     CRITICAL = "critical"
 
 
+# Levels that are written through immediately instead of waiting in the buffer
+_FLUSH_LEVELS = frozenset({"warning", "error", "critical"})
+
+
 class JSONLogCategory(str, Enum):
     """Log categories for semantic grouping"""
     PIPELINE = "pipeline"
@@ -45,6 +52,27 @@ class JSONLogCategory(str, Enum):
     SYSTEM = "system"
 
 
+# Live loggers, flushed by one exit handler. Weak so replaced loggers (e.g.
+# repeated init_logger calls) can be collected; one with buffered lines is
+# kept alive by its pending flush timer until that flush runs.
+_live_loggers: "weakref.WeakSet[JSONLogger]" = weakref.WeakSet()
+
+
+def _flush_live_loggers() -> None:
+    for logger in list(_live_loggers):
+        logger.flush()
+
+
+atexit.register(_flush_live_loggers)
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with millisecond precision and a ``Z`` suffix"""
+    now = time.time()
+    millis = int((now % 1) * 1000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + f".{millis:03d}Z"
+
+
 class JSONLogger:
     """
     Structured JSON logger that outputs one JSON object per line.
@@ -55,21 +83,43 @@ class JSONLogger:
     - category: Semantic category (pipeline, job, stage, etc.)
     - message: Human-readable message
     - data: Optional structured metadata
+
+    Lines are buffered and written in batches. The buffer is flushed when it
+    exceeds ``flush_threshold`` characters, ``flush_interval`` seconds after the
+    first buffered line, on any warning or higher, at pipeline/stage/job
+    boundaries, and at interpreter exit. The boundary flushes keep a run that is
+    killed (e.g. SIGTERM from the GUI, which skips ``atexit``) from losing the
+    lines that show where it stopped.
     """
 
-    def __init__(self, output_stream=None):
+    def __init__(
+        self,
+        output_stream=None,
+        flush_threshold: int = 64 * 1024,
+        flush_interval: float = 0.5,
+    ):
         """
         Initialize JSON logger
 
         Args:
             output_stream: Stream to write to (default: sys.stdout)
+            flush_threshold: Buffered characters that trigger a write
+            flush_interval: Max seconds a buffered line waits before being written
         """
         self.output_stream = output_stream or sys.stdout
+        self._flush_threshold = flush_threshold
+        self._flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._buffer_bytes = 0
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        _live_loggers.add(self)
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
 
     def _emit(
         self,
-        level: JSONLogLevel,
-        category: JSONLogCategory,
+        level: str,
+        category: str,
         message: str,
         data: Optional[Dict[str, Any]] = None,
         **kwargs
@@ -78,16 +128,16 @@ class JSONLogger:
         Emit a structured log entry as JSON
 
         Args:
-            level: Log level
-            category: Log category
+            level: Log level value (see JSONLogLevel)
+            category: Log category value (see JSONLogCategory)
             message: Human-readable message
             data: Optional structured data
             **kwargs: Additional fields to include
         """
         entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "level": level.value,
-            "category": category.value,
+            "timestamp": _utc_timestamp(),
+            "level": level,
+            "category": category,
             "message": message,
         }
 
@@ -98,41 +148,71 @@ class JSONLogger:
         # Add any additional fields
         entry.update(kwargs)
 
-        # Write as single-line JSON
+        # Buffer as single-line JSON
         try:
-            json_line = json.dumps(entry, ensure_ascii=False)
-            self.output_stream.write(json_line + "\n")
-            self.output_stream.flush()
+            json_line = self._encode(entry) + "\n"
         except Exception as e:
             # Fallback to stderr if JSON serialization fails
             sys.stderr.write(f"JSON logging error: {e}\n")
             sys.stderr.write(f"Message: {message}\n")
+            return
+
+        with self._lock:
+            self._buffer.append(json_line)
+            self._buffer_bytes += len(json_line)
+            if level in _FLUSH_LEVELS or self._buffer_bytes >= self._flush_threshold:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write any buffered log lines to the output stream"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """Write buffered lines; caller must hold ``self._lock``"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        chunk = "".join(self._buffer)
+        self._buffer.clear()
+        self._buffer_bytes = 0
+        try:
+            self.output_stream.write(chunk)
+            self.output_stream.flush()
+        except Exception as e:
+            sys.stderr.write(f"JSON logging error: {e}\n")
 
     # ========== STANDARD LOG LEVELS ==========
 
-    def debug(self, message: str, data: Optional[Dict[str, Any]] = None, category: JSONLogCategory = JSONLogCategory.SYSTEM) -> None:
+    def debug(self, message: str, data: Optional[Dict[str, Any]] = None, category: str = "system") -> None:
         """Debug level log"""
-        self._emit(JSONLogLevel.DEBUG, category, message, data)
+        self._emit("debug", category, message, data)
 
-    def info(self, message: str, data: Optional[Dict[str, Any]] = None, category: JSONLogCategory = JSONLogCategory.SYSTEM) -> None:
+    def info(self, message: str, data: Optional[Dict[str, Any]] = None, category: str = "system") -> None:
         """Info level log"""
-        self._emit(JSONLogLevel.INFO, category, message, data)
+        self._emit("info", category, message, data)
 
-    def success(self, message: str, data: Optional[Dict[str, Any]] = None, category: JSONLogCategory = JSONLogCategory.SYSTEM) -> None:
+    def success(self, message: str, data: Optional[Dict[str, Any]] = None, category: str = "system") -> None:
         """Success level log"""
-        self._emit(JSONLogLevel.SUCCESS, category, message, data)
+        self._emit("success", category, message, data)
 
-    def warning(self, message: str, data: Optional[Dict[str, Any]] = None, category: JSONLogCategory = JSONLogCategory.SYSTEM) -> None:
+    def warning(self, message: str, data: Optional[Dict[str, Any]] = None, category: str = "system") -> None:
         """Warning level log"""
-        self._emit(JSONLogLevel.WARNING, category, message, data)
+        self._emit("warning", category, message, data)
 
-    def error(self, message: str, data: Optional[Dict[str, Any]] = None, category: JSONLogCategory = JSONLogCategory.SYSTEM) -> None:
+    def error(self, message: str, data: Optional[Dict[str, Any]] = None, category: str = "system") -> None:
         """Error level log"""
-        self._emit(JSONLogLevel.ERROR, category, message, data)
+        self._emit("error", category, message, data)
 
-    def critical(self, message: str, data: Optional[Dict[str, Any]] = None, category: JSONLogCategory = JSONLogCategory.SYSTEM) -> None:
+    def critical(self, message: str, data: Optional[Dict[str, Any]] = None, category: str = "system") -> None:
         """Critical level log"""
-        self._emit(JSONLogLevel.CRITICAL, category, message, data)
+        self._emit("critical", category, message, data)
 
     # ========== PIPELINE-SPECIFIC METHODS ==========
 
@@ -148,7 +228,8 @@ class JSONLogger:
         if data:
             pipeline_data.update(data)
 
-        self._emit(JSONLogLevel.INFO, JSONLogCategory.PIPELINE, msg, pipeline_data)
+        self._emit("info", "pipeline", msg, pipeline_data)
+        self.flush()
 
     def pipeline_complete(self, elapsed: float, data: Optional[Dict[str, Any]] = None) -> None:
         """Log pipeline completion"""
@@ -157,11 +238,12 @@ class JSONLogger:
             complete_data.update(data)
 
         self._emit(
-            JSONLogLevel.SUCCESS,
-            JSONLogCategory.PIPELINE,
+            "success",
+            "pipeline",
             f"Pipeline completed in {elapsed:.2f}s",
             complete_data
         )
+        self.flush()
 
     def pipeline_failed(self, error: str, data: Optional[Dict[str, Any]] = None) -> None:
         """Log pipeline failure"""
@@ -169,7 +251,7 @@ class JSONLogger:
         if data:
             error_data.update(data)
 
-        self._emit(JSONLogLevel.ERROR, JSONLogCategory.PIPELINE, f"Pipeline failed: {error}", error_data)
+        self._emit("error", "pipeline", f"Pipeline failed: {error}", error_data)
 
     def pipeline_summary(self, total: int, success: int, failed: int, skipped: int, elapsed: float) -> None:
         """Log pipeline summary"""
@@ -182,11 +264,12 @@ class JSONLogger:
         }
 
         self._emit(
-            JSONLogLevel.INFO,
-            JSONLogCategory.PIPELINE,
+            "info",
+            "pipeline",
             "Pipeline Summary",
             summary_data
         )
+        self.flush()
 
     def stage_start(self, stage_name: str, data: Optional[Dict[str, Any]] = None) -> None:
         """Log stage start"""
@@ -195,11 +278,12 @@ class JSONLogger:
             stage_data.update(data)
 
         self._emit(
-            JSONLogLevel.INFO,
-            JSONLogCategory.STAGE,
+            "info",
+            "stage",
             f"STAGE: {stage_name.upper()}",
             stage_data
         )
+        self.flush()
 
     def job_start(self, stage: str, job_name: str, description: str = "", data: Optional[Dict[str, Any]] = None) -> None:
         """Log job start"""
@@ -210,11 +294,12 @@ class JSONLogger:
             job_data.update(data)
 
         self._emit(
-            JSONLogLevel.INFO,
-            JSONLogCategory.JOB,
+            "info",
+            "job",
             f"[{stage}] {job_name}",
             job_data
         )
+        self.flush()
 
     def job_success(self, stage: str, job_name: str, details: str = "", data: Optional[Dict[str, Any]] = None) -> None:
         """Log job success"""
@@ -228,7 +313,8 @@ class JSONLogger:
         if details:
             msg += f": {details}"
 
-        self._emit(JSONLogLevel.SUCCESS, JSONLogCategory.JOB, msg, job_data)
+        self._emit("success", "job", msg, job_data)
+        self.flush()
 
     def job_failed(self, stage: str, job_name: str, error: str, data: Optional[Dict[str, Any]] = None) -> None:
         """Log job failure"""
@@ -237,8 +323,8 @@ class JSONLogger:
             job_data.update(data)
 
         self._emit(
-            JSONLogLevel.ERROR,
-            JSONLogCategory.JOB,
+            "error",
+            "job",
             f"[{stage}] {job_name} FAILED: {error}",
             job_data
         )
@@ -255,7 +341,7 @@ class JSONLogger:
         if reason:
             msg += f": {reason}"
 
-        self._emit(JSONLogLevel.WARNING, JSONLogCategory.JOB, msg, job_data)
+        self._emit("warning", "job", msg, job_data)
 
     # ========== STAGE-SPECIFIC LOGGING ==========
 
@@ -266,8 +352,8 @@ class JSONLogger:
             extract_data.update(data)
 
         self._emit(
-            JSONLogLevel.DEBUG,
-            JSONLogCategory.EXTRACT,
+            "debug",
+            "extract",
             f"Reading: {file_name} ({rows} rows)",
             extract_data
         )
@@ -279,8 +365,8 @@ class JSONLogger:
             stage_data.update(data)
 
         self._emit(
-            JSONLogLevel.DEBUG,
-            JSONLogCategory.STAGE_DATA,
+            "debug",
+            "stage",
             f"Staging: {table_name} ({rows} rows)",
             stage_data
         )
@@ -292,8 +378,8 @@ class JSONLogger:
             transform_data.update(data)
 
         self._emit(
-            JSONLogLevel.DEBUG,
-            JSONLogCategory.TRANSFORM,
+            "debug",
+            "transform",
             "Executing SQL transformation",
             transform_data
         )
@@ -305,8 +391,8 @@ class JSONLogger:
             load_data.update(data)
 
         self._emit(
-            JSONLogLevel.DEBUG,
-            JSONLogCategory.LOAD,
+            "debug",
+            "load",
             f"Writing: {output_path} ({rows} rows)",
             load_data
         )
@@ -320,8 +406,8 @@ class JSONLogger:
             db_data.update(data)
 
         self._emit(
-            JSONLogLevel.INFO,
-            JSONLogCategory.DATABASE,
+            "info",
+            "database",
             f"{db_type.upper()} connection opened: {path}",
             db_data
         )
@@ -333,8 +419,8 @@ class JSONLogger:
             schema_data.update(data)
 
         self._emit(
-            JSONLogLevel.DEBUG,
-            JSONLogCategory.DATABASE,
+            "debug",
+            "database",
             f"Schema created: {schema}",
             schema_data
         )
@@ -6,11 +6,14 @@ Tracks data flow from sources through transformations to outputs
 from __future__ import annotations
 
 import json
+import sys
+from collections import deque
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from functools import partial
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 
 class LineageNodeType(str, Enum):
@@ -35,37 +38,75 @@ class TransformationType(str, Enum):
     PYTHON = "python"          # Python UDF
 
 
-@dataclass
+# Enum member -> plain value, so serialization loops do one dict lookup
+# instead of a truthiness check plus .value access
+_NODE_TYPE_VALUES: Dict[LineageNodeType, str] = {m: m.value for m in LineageNodeType}
+_TRANSFORMATION_VALUES: Dict[Optional[TransformationType], Optional[str]] = {m: m.value for m in TransformationType}
+_TRANSFORMATION_VALUES[None] = None
+
+
+@dataclass(frozen=True, slots=True)
 class ColumnLineage:
     """
     Lineage for a single column
 
-    Tracks upstream dependencies and transformations
+    Tracks upstream dependencies and transformations. Immutable once built.
     """
     column_name: str
     dataset_name: str
     node_type: LineageNodeType
-    upstream_columns: List[tuple[str, str]] = field(default_factory=list)  # [(dataset, column), ...]
+    upstream_columns: Tuple[tuple[str, str], ...] = ()  # ((dataset, column), ...); lists are accepted
     transformation_type: Optional[TransformationType] = None
     transformation_expr: Optional[str] = None  # SQL/Python expression
     transformation_desc: Optional[str] = None
     tags: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Names repeat across the graph: intern them so duplicates share one
+        # string and set/dict lookups compare by identity. Upstreams are stored
+        # as an exact-size tuple of tuples (JSON round-trips them as lists)
+        object.__setattr__(self, "column_name", sys.intern(self.column_name))
+        object.__setattr__(self, "dataset_name", sys.intern(self.dataset_name))
+        object.__setattr__(self, "upstream_columns", tuple(
+            (sys.intern(dataset), sys.intern(column)) for dataset, column in self.upstream_columns
+        ))
+
+    @classmethod
+    def _make_source(cls, dataset_name: str, column_name: str) -> ColumnLineage:
+        """
+        Build a SOURCE column without going through __init__/__post_init__
+
+        `dataset_name` must already be interned (callers intern it once per
+        dataset). Used by track_source, where wide tables make per-column
+        construction overhead noticeable.
+        """
+        obj = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(obj, "column_name", sys.intern(column_name))
+        setattr_(obj, "dataset_name", dataset_name)
+        setattr_(obj, "node_type", LineageNodeType.SOURCE)
+        setattr_(obj, "upstream_columns", ())
+        setattr_(obj, "transformation_type", None)
+        setattr_(obj, "transformation_expr", None)
+        setattr_(obj, "transformation_desc", None)
+        setattr_(obj, "tags", [])
+        return obj
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
             "column_name": self.column_name,
             "dataset_name": self.dataset_name,
-            "node_type": self.node_type.value,
-            "upstream_columns": self.upstream_columns,
-            "transformation_type": self.transformation_type.value if self.transformation_type else None,
+            "node_type": _NODE_TYPE_VALUES[self.node_type],
+            "upstream_columns": list(self.upstream_columns),
+            "transformation_type": _TRANSFORMATION_VALUES[self.transformation_type],
             "transformation_expr": self.transformation_expr,
             "transformation_desc": self.transformation_desc,
             "tags": self.tags
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DatasetLineage:
     """
     Lineage for an entire dataset
@@ -79,32 +120,94 @@ class DatasetLineage:
     metadata: Dict[str, Any] = field(default_factory=dict)
     run_id: Optional[str] = None
     timestamp: Optional[datetime] = None
+    # Aggregated get_upstream_datasets() result; reset by add_column
+    _upstream_cache: Optional[Set[str]] = field(default=None, init=False, repr=False, compare=False)
+    # Set by the owning LineageTracker: called as (previous, new) by add_column
+    _on_column_change: Optional[Callable[[Optional[ColumnLineage], ColumnLineage], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.dataset_name = sys.intern(self.dataset_name)
+        self.upstream_datasets = [sys.intern(name) for name in self.upstream_datasets]
 
     def add_column(self, col_lineage: ColumnLineage):
-        """Add column lineage"""
+        """Add column lineage (keeps the owning tracker's indexes in step)"""
+        previous = self.columns.get(col_lineage.column_name)
         self.columns[col_lineage.column_name] = col_lineage
+        self._upstream_cache = None
+        if self._on_column_change is not None:
+            self._on_column_change(previous, col_lineage)
 
     def get_upstream_datasets(self) -> Set[str]:
         """Get all upstream datasets"""
-        upstream = set(self.upstream_datasets)
-        for col_lineage in self.columns.values():
-            for dataset, _ in col_lineage.upstream_columns:
-                upstream.add(dataset)
-        return upstream
+        if self._upstream_cache is None:
+            upstream = set(self.upstream_datasets)
+            for col_lineage in self.columns.values():
+                for dataset, _ in col_lineage.upstream_columns:
+                    upstream.add(dataset)
+            self._upstream_cache = upstream
+        return set(self._upstream_cache)
+
+    def to_dict(self, epoch_timestamps: bool = False) -> Dict[str, Any]:
+        """
+        Convert to dictionary
+
+        Args:
+            epoch_timestamps: Emit the timestamp as epoch milliseconds (int)
+                instead of an ISO 8601 string; smaller and cheaper to parse
+        """
+        columns = {}
+        if self._upstream_cache is None:
+            # One pass builds the column dicts and the upstream dataset set
+            upstream = set(self.upstream_datasets)
+            for name, col in self.columns.items():
+                columns[name] = col.to_dict()
+                for dataset, _ in col.upstream_columns:
+                    upstream.add(dataset)
+            self._upstream_cache = upstream
+        else:
+            for name, col in self.columns.items():
+                columns[name] = col.to_dict()
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
         return {
             "dataset_name": self.dataset_name,
-            "node_type": self.node_type.value,
-            "columns": {name: col.to_dict() for name, col in self.columns.items()},
-            "upstream_datasets": list(self.get_upstream_datasets()),
+            "node_type": _NODE_TYPE_VALUES[self.node_type],
+            "columns": columns,
+            "upstream_datasets": list(self._upstream_cache),
             "metadata": self.metadata,
             "run_id": self.run_id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None
+            "timestamp": _format_timestamp(self.timestamp, epoch_timestamps)
         }
 
 
+def _format_timestamp(timestamp: Optional[datetime], epoch: bool) -> Any:
+    """Timestamp as ISO 8601 string, or epoch milliseconds when `epoch` is set"""
+    if timestamp is None:
+        return None
+    if epoch:
+        return int(timestamp.timestamp() * 1000)
+    return timestamp.isoformat()
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Inverse of _format_timestamp; accepts either representation"""
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000)
+    return datetime.fromisoformat(value)
+
+
+def _lineage_default(obj: Any, epoch_timestamps: bool = False) -> Any:
+    """json default hook: serialize lineage nodes as they are reached"""
+    if isinstance(obj, DatasetLineage):
+        return obj.to_dict(epoch_timestamps)
+    if isinstance(obj, ColumnLineage):
+        return obj.to_dict()
+    return str(obj)
+
+
 class LineageTracker:
     """
     Lineage tracking system
@@ -141,6 +244,52 @@ class LineageTracker:
     def __init__(self):
         self.datasets: Dict[str, DatasetLineage] = {}
         self.run_id: Optional[str] = None
+        self._upstream_cache: Dict[tuple[str, str], List[tuple[str, str]]] = {}
+        self._downstream_cache: Dict[tuple[str, str], List[tuple[str, str]]] = {}
+        # (dataset, column) -> columns listing it upstream, kept in step with self.datasets
+        self._downstream_index: Dict[tuple[str, str], List[tuple[str, str]]] = {}
+
+    def _invalidate(self):
+        """Drop caches derived from self.datasets after it changes"""
+        self._upstream_cache.clear()
+        self._downstream_cache.clear()
+
+    def _set_dataset(self, dataset_name: str, lineage: DatasetLineage):
+        """Store dataset lineage, replacing any previous version, and update indexes"""
+        previous = self.datasets.get(dataset_name)
+        if previous is not None:
+            self._index_downstream(dataset_name, previous, remove=True)
+            previous._on_column_change = None
+        self.datasets[dataset_name] = lineage
+        self._index_downstream(dataset_name, lineage)
+        # Columns added later via lineage.add_column() update the index too
+        lineage._on_column_change = partial(self._column_changed, dataset_name)
+        self._invalidate()
+
+    def _column_changed(
+        self, dataset_name: str, previous: Optional[ColumnLineage], col_lineage: ColumnLineage
+    ):
+        """Re-index one column added to (or replaced in) a tracked dataset"""
+        node = (dataset_name, col_lineage.column_name)
+        if previous is not None:
+            self._index_column(node, previous, remove=True)
+        self._index_column(node, col_lineage)
+        self._invalidate()
+
+    def _index_downstream(self, dataset_name: str, lineage: DatasetLineage, remove: bool = False):
+        """Add (or remove) a dataset's columns in the reverse-adjacency index"""
+        for col_name, col_lineage in lineage.columns.items():
+            self._index_column((dataset_name, col_name), col_lineage, remove)
+
+    def _index_column(self, node: tuple[str, str], col_lineage: ColumnLineage, remove: bool = False):
+        """Add (or remove) one column's upstream edges in the reverse-adjacency index"""
+        for upstream in dict.fromkeys(col_lineage.upstream_columns):
+            if remove:
+                dependents = self._downstream_index.get(upstream)
+                if dependents and node in dependents:
+                    dependents.remove(node)
+            else:
+                self._downstream_index.setdefault(upstream, []).append(node)
 
     def set_run_id(self, run_id: str):
         """Set run ID for all tracked datasets"""
@@ -160,24 +309,43 @@ class LineageTracker:
             columns: List of column names
             metadata: Optional metadata (file_path, table_name, etc.)
         """
+        self._set_dataset(dataset_name, self._source_lineage(dataset_name, columns, metadata, datetime.now()))
+
+    def bulk_track_source(
+        self,
+        specs: List[tuple[str, List[str], Optional[Dict[str, Any]]]]
+    ):
+        """
+        Track many source datasets at once
+
+        Args:
+            specs: List of (dataset_name, columns, metadata) tuples, as for track_source
+        """
+        timestamp = datetime.now()
+        for dataset_name, columns, metadata in specs:
+            self._set_dataset(
+                dataset_name, self._source_lineage(dataset_name, columns, metadata, timestamp)
+            )
+
+    def _source_lineage(
+        self,
+        dataset_name: str,
+        columns: List[str],
+        metadata: Optional[Dict[str, Any]],
+        timestamp: datetime
+    ) -> DatasetLineage:
+        """DatasetLineage for a source, with columns built on the fast path"""
         lineage = DatasetLineage(
             dataset_name=dataset_name,
             node_type=LineageNodeType.SOURCE,
             metadata=metadata or {},
             run_id=self.run_id,
-            timestamp=datetime.now()
+            timestamp=timestamp
         )
-
-        for col in columns:
-            lineage.add_column(
-                ColumnLineage(
-                    column_name=col,
-                    dataset_name=dataset_name,
-                    node_type=LineageNodeType.SOURCE
-                )
-            )
-
-        self.datasets[dataset_name] = lineage
+        make_source = ColumnLineage._make_source
+        name = lineage.dataset_name  # interned by DatasetLineage
+        lineage.columns = {col: make_source(name, col) for col in columns}
+        return lineage
 
     def track_transform(
         self,
@@ -204,7 +372,7 @@ class LineageTracker:
         for col_name, col_lineage in output_columns.items():
             lineage.add_column(col_lineage)
 
-        self.datasets[output_dataset] = lineage
+        self._set_dataset(output_dataset, lineage)
 
     def track_output(
         self,
@@ -224,7 +392,7 @@ class LineageTracker:
         for col_name, col_lineage in columns.items():
             lineage.add_column(col_lineage)
 
-        self.datasets[output_dataset] = lineage
+        self._set_dataset(output_dataset, lineage)
 
     def track_simple_transform(
         self,
@@ -284,24 +452,41 @@ class LineageTracker:
             recursive: If True, traverse all the way to sources
 
         Returns:
-            List of (dataset, column) tuples
+            List of (dataset, column) tuples, nearest first (depth-first order).
+            Each upstream column is listed once, even when it is reachable
+            through several paths.
         """
         col_lineage = self.get_column_lineage(dataset_name, column_name)
         if not col_lineage:
             return []
 
-        upstream = col_lineage.upstream_columns.copy()
+        if not recursive:
+            return list(col_lineage.upstream_columns)
+
+        key = (dataset_name, column_name)
+        cached = self._upstream_cache.get(key)
+        if cached is None:
+            cached = self._upstream_cache[key] = self._walk_upstream(col_lineage)
+        return cached.copy()
+
+    def _walk_upstream(self, col_lineage: ColumnLineage) -> List[tuple[str, str]]:
+        """Iterative depth-first walk of upstream columns, visiting each node once"""
+        visited: Set[tuple[str, str]] = set()
+        all_upstream: List[tuple[str, str]] = []
+        stack = list(reversed(col_lineage.upstream_columns))
 
-        if recursive:
-            all_upstream = []
-            for up_dataset, up_col in upstream:
-                all_upstream.append((up_dataset, up_col))
-                # Recurse
-                nested = self.get_upstream_columns(up_dataset, up_col, recursive=True)
-                all_upstream.extend(nested)
-            return all_upstream
+        while stack:
+            node = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            all_upstream.append(node)
 
-        return upstream
+            up_lineage = self.get_column_lineage(*node)
+            if up_lineage:
+                stack.extend(reversed(up_lineage.upstream_columns))
+
+        return all_upstream
 
     def get_downstream_columns(
         self, dataset_name: str, column_name: str
@@ -312,14 +497,32 @@ class LineageTracker:
         Returns:
             List of (dataset, column) tuples
         """
-        downstream = []
+        return self._downstream_index.get((dataset_name, column_name), []).copy()
 
-        for ds_name, ds_lineage in self.datasets.items():
-            for col_name, col_lineage in ds_lineage.columns.items():
-                if (dataset_name, column_name) in col_lineage.upstream_columns:
-                    downstream.append((ds_name, col_name))
+    def get_downstream_closure(
+        self, dataset_name: str, column_name: str
+    ) -> List[tuple[str, str]]:
+        """
+        Get every column that depends on given column, directly or transitively
 
-        return downstream
+        Returns:
+            List of (dataset, column) tuples in breadth-first order, each once
+        """
+        key = (dataset_name, column_name)
+        cached = self._downstream_cache.get(key)
+        if cached is None:
+            visited: Set[tuple[str, str]] = {key}
+            closure: List[tuple[str, str]] = []
+            queue = deque(self._downstream_index.get(key, ()))
+            while queue:
+                node = queue.popleft()
+                if node in visited:
+                    continue
+                visited.add(node)
+                closure.append(node)
+                queue.extend(self._downstream_index.get(node, ()))
+            cached = self._downstream_cache[key] = closure
+        return cached.copy()
 
     def get_lineage_graph(self) -> Dict[str, Any]:
         """
@@ -336,31 +539,30 @@ class LineageTracker:
             nodes.append({
                 "id": ds_name,
                 "type": "dataset",
-                "node_type": ds_lineage.node_type.value,
+                "node_type": _NODE_TYPE_VALUES[ds_lineage.node_type],
                 "label": ds_name
             })
 
             for col_name, col_lineage in ds_lineage.columns.items():
                 # Add column node
                 col_id = f"{ds_name}.{col_name}"
+                transformation = _TRANSFORMATION_VALUES[col_lineage.transformation_type]
                 nodes.append({
                     "id": col_id,
                     "type": "column",
-                    "node_type": col_lineage.node_type.value,
+                    "node_type": _NODE_TYPE_VALUES[col_lineage.node_type],
                     "label": col_name,
                     "dataset": ds_name,
-                    "transformation": col_lineage.transformation_type.value if col_lineage.transformation_type else None,
+                    "transformation": transformation,
                     "expression": col_lineage.transformation_expr
                 })
 
                 # Add edges from upstream columns
-                for up_dataset, up_col in col_lineage.upstream_columns:
-                    up_col_id = f"{up_dataset}.{up_col}"
-                    edges.append({
-                        "source": up_col_id,
-                        "target": col_id,
-                        "type": col_lineage.transformation_type.value if col_lineage.transformation_type else "unknown"
-                    })
+                edge_type = transformation or "unknown"
+                edges.extend(
+                    {"source": f"{up_dataset}.{up_col}", "target": col_id, "type": edge_type}
+                    for up_dataset, up_col in col_lineage.upstream_columns
+                )
 
         return {
             "nodes": nodes,
@@ -371,31 +573,39 @@ class LineageTracker:
             }
         }
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, epoch_timestamps: bool = False) -> Dict[str, Any]:
         """Convert entire lineage to dictionary"""
         return {
             "run_id": self.run_id,
-            "datasets": {name: ds.to_dict() for name, ds in self.datasets.items()}
+            "datasets": {name: ds.to_dict(epoch_timestamps) for name, ds in self.datasets.items()}
         }
 
-    def to_json(self, file_path: Optional[Path] = None, indent: int = 2) -> str:
+    def to_json(
+        self, file_path: Optional[Path] = None, indent: int = 2, epoch_timestamps: bool = False
+    ) -> Optional[str]:
         """
         Export lineage to JSON
 
         Args:
             file_path: Optional file to write JSON
             indent: JSON indentation
+            epoch_timestamps: Write timestamps as epoch milliseconds (from_json reads both forms)
 
         Returns:
-            JSON string
+            JSON string, or None when written to file_path (the document is
+            streamed to the file and never held in memory as one string)
         """
-        data = self.to_dict()
-        json_str = json.dumps(data, indent=indent, default=str)
+        # Datasets are converted one at a time during encoding instead of
+        # materializing the whole to_dict() tree up front
+        data = {"run_id": self.run_id, "datasets": self.datasets}
+        default = partial(_lineage_default, epoch_timestamps=epoch_timestamps)
 
         if file_path:
-            file_path.write_text(json_str, encoding="utf-8")
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=indent, default=default)
+            return None
 
-        return json_str
+        return json.dumps(data, indent=indent, default=default)
 
     @classmethod
     def from_json(cls, json_str: str) -> LineageTracker:
@@ -424,10 +634,10 @@ class LineageTracker:
                 columns=columns,
                 metadata=ds_data.get("metadata", {}),
                 run_id=ds_data.get("run_id"),
-                timestamp=datetime.fromisoformat(ds_data["timestamp"]) if ds_data.get("timestamp") else None
+                timestamp=_parse_timestamp(ds_data.get("timestamp"))
             )
 
-            tracker.datasets[ds_name] = dataset_lineage
+            tracker._set_dataset(ds_name, dataset_lineage)
 
         return tracker
 
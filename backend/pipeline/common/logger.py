@@ -8,7 +8,8 @@ JSON mode: Structured JSON-Lines output for external integrations (e.g., Electro
 from __future__ import annotations
 
 import sys
-from datetime import datetime
+import time
+from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Optional, Any
 from pathlib import Path
@@ -27,141 +28,82 @@ class LogFormat(Enum):
     JSON = "json"      # Structured JSON-Lines format
 
 
-class Logger:
-    """Pipeline logger with configurable verbosity and output format"""
+class Logger(ABC):
+    """
+    Pipeline logger with configurable verbosity and output format
+
+    Logger(level, format) returns the subclass for that format (TextLogger or
+    JsonLogger), so per-call methods never branch on the output format.
+    """
+
+    def __new__(cls, level: LogLevel = LogLevel.USER, format: LogFormat = LogFormat.TEXT):
+        if cls is Logger:
+            cls = JsonLogger if format == LogFormat.JSON else TextLogger
+        return super().__new__(cls)
 
     def __init__(self, level: LogLevel = LogLevel.USER, format: LogFormat = LogFormat.TEXT):
         self.level = level
         self.format = format
-        self._colors_enabled = sys.stdout.isatty() and format == LogFormat.TEXT
-        self._json_logger = None
-
-        # Initialize JSON logger if needed
-        if format == LogFormat.JSON:
-            from pipeline.common.json_formatter import JSONLogger
-            self._json_logger = JSONLogger()
-
-    def _timestamp(self) -> str:
-        """Get formatted timestamp"""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    def _format_message(self, msg: str, prefix: str = "", color: str = "") -> str:
-        """Format a log message with optional color"""
-        ts = self._timestamp()
-        if self._colors_enabled and color:
-            return f"{color}[{ts}]{prefix} {msg}\033[0m"
-        return f"[{ts}]{prefix} {msg}"
+    def flush(self) -> None:
+        """Flush buffered log output"""
+        sys.stdout.flush()
 
     # ========== USER-LEVEL LOGGING (Always shown) ==========
 
+    @abstractmethod
     def info(self, msg: str) -> None:
         """Info message (shown in all modes)"""
-        if self.format == LogFormat.JSON:
-            self._json_logger.info(msg)
-        else:
-            print(self._format_message(msg, color="\033[36m"))  # Cyan
 
+    @abstractmethod
     def success(self, msg: str) -> None:
         """Success message (shown in all modes)"""
-        if self.format == LogFormat.JSON:
-            self._json_logger.success(msg)
-        else:
-            print(self._format_message(msg, prefix=" [OK]", color="\033[32m"))  # Green
 
+    @abstractmethod
     def warning(self, msg: str) -> None:
         """Warning message (shown in all modes)"""
-        if self.format == LogFormat.JSON:
-            self._json_logger.warning(msg)
-        else:
-            print(self._format_message(msg, prefix=" [WARN]", color="\033[33m"))  # Yellow
 
+    @abstractmethod
     def error(self, msg: str) -> None:
         """Error message (shown in all modes)"""
-        if self.format == LogFormat.JSON:
-            self._json_logger.error(msg)
-        else:
-            print(self._format_message(msg, prefix=" [ERROR]", color="\033[31m"))  # Red
 
+    @abstractmethod
     def stage(self, stage_name: str) -> None:
         """Stage header (shown in all modes)"""
-        if self.format == LogFormat.JSON:
-            self._json_logger.stage_start(stage_name)
-        else:
-            line = "=" * 60
-            print(f"\n{self._format_message(line, color='\033[35m')}")  # Magenta
-            print(self._format_message(f"STAGE: {stage_name.upper()}", color="\033[35m\033[1m"))  # Bold Magenta
-            print(f"{self._format_message(line, color='\033[35m')}\n")
 
     # ========== DEV-LEVEL LOGGING (Shown in dev/debug modes) ==========
 
+    @abstractmethod
     def dev(self, msg: str) -> None:
         """Development message (shown only in dev/debug mode)"""
-        if self.level in (LogLevel.DEV, LogLevel.DEBUG):
-            if self.format == LogFormat.JSON:
-                self._json_logger.debug(msg)
-            else:
-                print(self._format_message(msg, prefix=" [DEV]", color="\033[90m"))  # Gray
 
+    @abstractmethod
     def dev_detail(self, label: str, value: Any) -> None:
         """Development detail (shown only in dev/debug mode)"""
-        if self.level in (LogLevel.DEV, LogLevel.DEBUG):
-            if self.format == LogFormat.JSON:
-                self._json_logger.debug(f"{label}: {value}", data={"label": label, "value": str(value)})
-            else:
-                print(self._format_message(f"{label}: {value}", prefix=" [DEV]", color="\033[90m"))
 
     # ========== DEBUG-LEVEL LOGGING (Shown only in debug mode) ==========
 
+    @abstractmethod
     def debug(self, msg: str) -> None:
         """Debug message (shown only in debug mode)"""
-        if self.level == LogLevel.DEBUG:
-            if self.format == LogFormat.JSON:
-                self._json_logger.debug(msg)
-            else:
-                print(self._format_message(msg, prefix=" [DEBUG]", color="\033[90m"))
 
     # ========== SPECIALIZED LOGGING METHODS ==========
 
+    @abstractmethod
     def job_start(self, stage: str, job_name: str, description: str = "") -> None:
         """Log job start"""
-        if self.format == LogFormat.JSON:
-            self._json_logger.job_start(stage, job_name, description)
-        elif self.level == LogLevel.USER:
-            print(self._format_message(f"[{stage}] {job_name}", color="\033[36m"))
-        else:
-            print(self._format_message(f"[{stage}] Running: {job_name}", color="\033[36m"))
-            if description:
-                self.dev(f"  Description: {description}")
 
+    @abstractmethod
     def job_success(self, stage: str, job_name: str, details: str = "") -> None:
         """Log job success"""
-        if self.format == LogFormat.JSON:
-            self._json_logger.job_success(stage, job_name, details)
-        elif self.level == LogLevel.USER:
-            msg = f"[{stage}] {job_name}"
-            if details:
-                msg += f" - {details}"
-            self.success(msg)
-        else:
-            self.success(f"[{stage}] {job_name}: {details if details else 'completed'}")
 
+    @abstractmethod
     def job_failed(self, stage: str, job_name: str, error: str) -> None:
         """Log job failure"""
-        if self.format == LogFormat.JSON:
-            self._json_logger.job_failed(stage, job_name, error)
-        else:
-            self.error(f"[{stage}] {job_name} FAILED: {error}")
 
+    @abstractmethod
     def job_skipped(self, stage: str, job_name: str, reason: str = "") -> None:
         """Log job skipped"""
-        if self.level != LogLevel.USER or self.format == LogFormat.JSON:
-            if self.format == LogFormat.JSON:
-                self._json_logger.job_skipped(stage, job_name, reason)
-            else:
-                msg = f"[{stage}] {job_name} skipped"
-                if reason:
-                    msg += f": {reason}"
-                self.warning(msg)
 
     # ========== EXTRACT STAGE LOGGING ==========
 
@@ -174,6 +116,8 @@ class Logger:
 
     def extract_file(self, file_path: Path, rows: int) -> None:
         """Log file extraction"""
+        if self.level == LogLevel.USER:
+            return
         self.dev(f"    Reading: {file_path.name} ({rows} rows)")
 
     def extract_success(self, job_name: str, table_name: str, total_rows: int, files_count: int = 1) -> None:
@@ -201,6 +145,8 @@ class Logger:
 
     def stage_table(self, table_name: str, rows: int) -> None:
         """Log table staging"""
+        if self.level == LogLevel.USER:
+            return
         self.dev(f"    Staging: {table_name} ({rows} rows)")
 
     def stage_success(self, job_name: str, schema: str, table_count: int) -> None:
@@ -219,11 +165,12 @@ class Logger:
 
     def transform_sql(self, sql: str) -> None:
         """Log SQL being executed"""
-        if self.level == LogLevel.DEBUG:
-            self.debug("  SQL:")
-            for line in sql.split('\n'):
-                if line.strip():
-                    self.debug(f"    {line}")
+        if self.level != LogLevel.DEBUG:
+            return
+        self.debug("  SQL:")
+        for line in sql.split('\n'):
+            if line.strip():
+                self.debug(f"    {line}")
 
     def transform_success(self, job_name: str, table_created: str = "") -> None:
         """Log transform success"""
@@ -245,11 +192,12 @@ class Logger:
 
     def load_query(self, query: str) -> None:
         """Log query being executed for load"""
-        if self.level == LogLevel.DEBUG:
-            self.debug("  Query:")
-            for line in query.split('\n'):
-                if line.strip():
-                    self.debug(f"    {line}")
+        if self.level != LogLevel.DEBUG:
+            return
+        self.debug("  Query:")
+        for line in query.split('\n'):
+            if line.strip():
+                self.debug(f"    {line}")
 
     def load_success(self, job_name: str, output_path: str, row_count: int) -> None:
         """Log load success"""
@@ -260,41 +208,21 @@ class Logger:
 
     # ========== PIPELINE SUMMARY ==========
 
+    @abstractmethod
     def pipeline_start(self, name: str, version: str = "") -> None:
         """Log pipeline start"""
-        if self.format == LogFormat.JSON:
-            self._json_logger.pipeline_start(name, version)
-        else:
-            msg = f"Starting Pipeline: {name}"
-            if version:
-                msg += f" (v{version})"
-            self.info(msg)
 
+    @abstractmethod
     def pipeline_summary(self, total_jobs: int, success: int, failed: int, skipped: int, elapsed: float) -> None:
         """Log pipeline summary"""
-        if self.format == LogFormat.JSON:
-            self._json_logger.pipeline_summary(total_jobs, success, failed, skipped, elapsed)
-        else:
-            line = "=" * 60
-            print(f"\n{line}")
-            print(f"PIPELINE SUMMARY")
-            print(line)
-            print(f"  Total Jobs:    {total_jobs}")
-            print(f"  Success:       {success}")
-            if failed > 0:
-                print(f"  Failed:        {failed}")
-            if skipped > 0:
-                print(f"  Skipped:       {skipped}")
-            print(f"  Elapsed Time:  {elapsed:.2f}s")
-            print(line)
 
     def pipeline_failed_jobs(self, failed_jobs: list[tuple[str, str]]) -> None:
         """Log details of failed jobs"""
         if failed_jobs:
-            print("\nFailed Jobs:")
+            parts = ["\nFailed Jobs:\n"]
             for job_name, error in failed_jobs:
-                print(f"  ✗ {job_name}")
-                print(f"    Error: {error}")
+                parts.append(f"  ✗ {job_name}\n    Error: {error}\n")
+            sys.stdout.write("".join(parts))
 
     # ========== DATABASE LOGGING ==========
 
@@ -305,13 +233,204 @@ class Logger:
 
     def db_schema_created(self, schema: str) -> None:
         """Log schema creation"""
+        if self.level == LogLevel.USER:
+            return
         self.dev(f"  Schema created: {schema}")
 
     def db_reset(self, path: str) -> None:
         """Log database reset"""
+        if self.level == LogLevel.USER:
+            return
         self.dev(f"  Database reset: {path}")
 
 
+class TextLogger(Logger):
+    """Human-readable logger writing timestamped, optionally colored lines to stdout"""
+
+    # ANSI color codes
+    _COLORS = {
+        "cyan": "\033[36m",
+        "green": "\033[32m",
+        "yellow": "\033[33m",
+        "red": "\033[31m",
+        "magenta": "\033[35m",
+        "bold_magenta": "\033[35m\033[1m",
+        "gray": "\033[90m",
+    }
+    _RESET = "\033[0m"
+    _STAGE_LINE = "=" * 60
+
+    def __init__(self, level: LogLevel = LogLevel.USER, format: LogFormat = LogFormat.TEXT):
+        super().__init__(level, LogFormat.TEXT)
+        self._colors_enabled = sys.stdout.isatty()
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
+
+    def _timestamp(self) -> str:
+        """Get formatted timestamp (formatted at most once per second)"""
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._last_ts_sec = now
+        return self._last_ts_str
+
+    def _write(self, line: str) -> None:
+        """Write one line to stdout in a single call (print() issues two writes)"""
+        sys.stdout.write(line + "\n")
+
+    def _format_message(self, msg: str, prefix: str = "", color: str = "") -> str:
+        """Format a log message with optional color"""
+        ts = self._timestamp()
+        if self._colors_enabled and color:
+            return f"{color}[{ts}]{prefix} {msg}{self._RESET}"
+        return f"[{ts}]{prefix} {msg}"
+
+    def info(self, msg: str) -> None:
+        self._write(self._format_message(msg, color=self._COLORS["cyan"]))
+
+    def success(self, msg: str) -> None:
+        self._write(self._format_message(msg, prefix=" [OK]", color=self._COLORS["green"]))
+
+    def warning(self, msg: str) -> None:
+        self._write(self._format_message(msg, prefix=" [WARN]", color=self._COLORS["yellow"]))
+
+    def error(self, msg: str) -> None:
+        self._write(self._format_message(msg, prefix=" [ERROR]", color=self._COLORS["red"]))
+        self.flush()
+
+    def stage(self, stage_name: str) -> None:
+        rule = self._format_message(self._STAGE_LINE, color=self._COLORS["magenta"])
+        title = self._format_message(f"STAGE: {stage_name.upper()}", color=self._COLORS["bold_magenta"])
+        sys.stdout.write(f"\n{rule}\n{title}\n{rule}\n\n")
+        self.flush()
+
+    def dev(self, msg: str) -> None:
+        if self.level in (LogLevel.DEV, LogLevel.DEBUG):
+            self._write(self._format_message(msg, prefix=" [DEV]", color=self._COLORS["gray"]))
+
+    def dev_detail(self, label: str, value: Any) -> None:
+        if self.level in (LogLevel.DEV, LogLevel.DEBUG):
+            self._write(self._format_message(f"{label}: {value}", prefix=" [DEV]", color=self._COLORS["gray"]))
+
+    def debug(self, msg: str) -> None:
+        if self.level == LogLevel.DEBUG:
+            self._write(self._format_message(msg, prefix=" [DEBUG]", color=self._COLORS["gray"]))
+
+    def job_start(self, stage: str, job_name: str, description: str = "") -> None:
+        if self.level == LogLevel.USER:
+            self._write(self._format_message(f"[{stage}] {job_name}", color=self._COLORS["cyan"]))
+        else:
+            self._write(self._format_message(f"[{stage}] Running: {job_name}", color=self._COLORS["cyan"]))
+            if description:
+                self.dev(f"  Description: {description}")
+
+    def job_success(self, stage: str, job_name: str, details: str = "") -> None:
+        if self.level == LogLevel.USER:
+            msg = f"[{stage}] {job_name}"
+            if details:
+                msg += f" - {details}"
+            self.success(msg)
+        else:
+            self.success(f"[{stage}] {job_name}: {details if details else 'completed'}")
+
+    def job_failed(self, stage: str, job_name: str, error: str) -> None:
+        self.error(f"[{stage}] {job_name} FAILED: {error}")
+
+    def job_skipped(self, stage: str, job_name: str, reason: str = "") -> None:
+        if self.level != LogLevel.USER:
+            msg = f"[{stage}] {job_name} skipped"
+            if reason:
+                msg += f": {reason}"
+            self.warning(msg)
+
+    def pipeline_start(self, name: str, version: str = "") -> None:
+        msg = f"Starting Pipeline: {name}"
+        if version:
+            msg += f" (v{version})"
+        self.info(msg)
+
+    def pipeline_summary(self, total_jobs: int, success: int, failed: int, skipped: int, elapsed: float) -> None:
+        line = self._STAGE_LINE
+        parts = [
+            f"\n{line}\n",
+            "PIPELINE SUMMARY\n",
+            f"{line}\n",
+            f"  Total Jobs:    {total_jobs}\n",
+            f"  Success:       {success}\n",
+        ]
+        if failed > 0:
+            parts.append(f"  Failed:        {failed}\n")
+        if skipped > 0:
+            parts.append(f"  Skipped:       {skipped}\n")
+        parts.append(f"  Elapsed Time:  {elapsed:.2f}s\n")
+        parts.append(f"{line}\n")
+        sys.stdout.write("".join(parts))
+        self.flush()
+
+
+class JsonLogger(Logger):
+    """Structured logger emitting JSON-Lines through JSONLogger (for the GUI)"""
+
+    def __init__(self, level: LogLevel = LogLevel.USER, format: LogFormat = LogFormat.JSON):
+        super().__init__(level, LogFormat.JSON)
+        from pipeline.common.json_formatter import JSONLogger
+        self._json_logger = JSONLogger()
+
+    def flush(self) -> None:
+        self._json_logger.flush()
+        sys.stdout.flush()
+
+    def pipeline_failed_jobs(self, failed_jobs: list[tuple[str, str]]) -> None:
+        # Written straight to stdout: flush buffered JSON lines first so they keep their order
+        self._json_logger.flush()
+        super().pipeline_failed_jobs(failed_jobs)
+
+    def info(self, msg: str) -> None:
+        self._json_logger.info(msg)
+
+    def success(self, msg: str) -> None:
+        self._json_logger.success(msg)
+
+    def warning(self, msg: str) -> None:
+        self._json_logger.warning(msg)
+
+    def error(self, msg: str) -> None:
+        self._json_logger.error(msg)
+
+    def stage(self, stage_name: str) -> None:
+        self._json_logger.stage_start(stage_name)
+
+    def dev(self, msg: str) -> None:
+        if self.level in (LogLevel.DEV, LogLevel.DEBUG):
+            self._json_logger.debug(msg)
+
+    def dev_detail(self, label: str, value: Any) -> None:
+        if self.level in (LogLevel.DEV, LogLevel.DEBUG):
+            self._json_logger.debug(f"{label}: {value}", data={"label": label, "value": str(value)})
+
+    def debug(self, msg: str) -> None:
+        if self.level == LogLevel.DEBUG:
+            self._json_logger.debug(msg)
+
+    def job_start(self, stage: str, job_name: str, description: str = "") -> None:
+        self._json_logger.job_start(stage, job_name, description)
+
+    def job_success(self, stage: str, job_name: str, details: str = "") -> None:
+        self._json_logger.job_success(stage, job_name, details)
+
+    def job_failed(self, stage: str, job_name: str, error: str) -> None:
+        self._json_logger.job_failed(stage, job_name, error)
+
+    def job_skipped(self, stage: str, job_name: str, reason: str = "") -> None:
+        self._json_logger.job_skipped(stage, job_name, reason)
+
+    def pipeline_start(self, name: str, version: str = "") -> None:
+        self._json_logger.pipeline_start(name, version)
+
+    def pipeline_summary(self, total_jobs: int, success: int, failed: int, skipped: int, elapsed: float) -> None:
+        self._json_logger.pipeline_summary(total_jobs, success, failed, skipped, elapsed)
+
+
 # Global logger instance
 _logger: Optional[Logger] = None
 
@@ -1,24 +1,41 @@
 from __future__ import annotations
+import os
+import shutil
 from pathlib import Path
 
 def nuke_duckdb(db_path: Path) -> None:
     """
     Remove a DuckDB file and common sidecars if they exist.
     Safe to call even if nothing is there.
+
+    Sidecars: the write-ahead log (<db>.wal) and DuckDB's default spill
+    directory (<db>.tmp), which would otherwise be picked up on reopen.
+    The parent directory is created if missing.
     """
-    try:
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-    except Exception:
-        pass
+    name = os.path.normcase(db_path.name)  # case-insensitive match on Windows
+    targets = {name, name + ".wal", name + ".tmp"}
 
-    # main file
-    for p in [
-        db_path,
-        Path(str(db_path) + ".wal"),  # DuckDB WAL lives alongside the db
-    ]:
+    # One directory scan finds whatever exists; no per-candidate stat
+    try:
+        entries = os.scandir(db_path.parent)
+    except FileNotFoundError:
         try:
-            if p.exists():
-                p.unlink()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
         except Exception:
-            # best-effort; ignore if another process holds a lock
             pass
+        return
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if os.path.normcase(entry.name) not in targets:
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+            except OSError:
+                # best-effort; ignore if another process holds a lock
+                pass
@@ -1,17 +1,94 @@
 from __future__ import annotations
+import inspect
+from typing import TYPE_CHECKING, Any
+
 import polars as pl
 
-def to_pandas(df: pl.DataFrame):
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def _polars_major() -> int:
+    """Leading component of pl.__version__ (0 if it cannot be parsed)"""
+    head = str(getattr(pl, "__version__", "")).split(".", 1)[0]
+    return int(head) if head.isdigit() else 0
+
+
+# Polars <= 0.20 often accepted `use_pyarrow=...`; Polars >= 1.0 removed that
+# kwarg. Decide once at import instead of catching TypeError (after a wasted
+# conversion attempt) on every call. The signature is the primary probe; if it
+# cannot be introspected, fall back to the installed version.
+try:
+    _TO_PANDAS_PARAMS = inspect.signature(pl.DataFrame.to_pandas).parameters
+    _ACCEPTS_USE_PYARROW = "use_pyarrow" in _TO_PANDAS_PARAMS
+    _ACCEPTS_EXTENSION_ARRAY = "use_pyarrow_extension_array" in _TO_PANDAS_PARAMS
+except (TypeError, ValueError):
+    _ACCEPTS_USE_PYARROW = _polars_major() < 1
+    _ACCEPTS_EXTENSION_ARRAY = not _ACCEPTS_USE_PYARROW
+
+if _ACCEPTS_USE_PYARROW:
+    def _to_pandas(df: pl.DataFrame, **kwargs: Any):
+        return df.to_pandas(use_pyarrow=False, **kwargs)  # type: ignore[call-arg]
+else:
+    _to_pandas = pl.DataFrame.to_pandas
+
+
+def _to_pandas_arrow_backed(df: pl.DataFrame):
+    """pandas frame whose columns wrap the Arrow buffers (pd.ArrowDtype), no copy"""
+    if _ACCEPTS_EXTENSION_ARRAY:
+        # Polars already converts with split_blocks/self_destruct on this path
+        return df.to_pandas(use_pyarrow_extension_array=True)
+
+    import pandas as pd
+    return df.to_arrow().to_pandas(types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True)
+
+
+def _to_pandas_column_wise(df: pl.DataFrame):
+    """
+    NumPy-backed pandas frame built one column at a time
+
+    Each column is removed from `df` once converted, so its Polars buffer
+    can be freed before the next one is copied. Consumes `df`.
+    """
+    import pandas as pd
+
+    height = df.height
+    columns = {}
+    for name in df.columns:
+        columns[name] = df.drop_in_place(name).to_pandas()
+    return pd.DataFrame(columns, index=pd.RangeIndex(height), copy=False)
+
+
+def to_pandas(
+    df: pl.DataFrame, *, zero_copy: bool = False, low_memory: bool = False, **kwargs: Any
+):
     """
     Convert a Polars DataFrame to pandas across Polars versions.
 
-    Polars <= 0.20 often accepted `use_pyarrow=...`.
-    Polars >= 1.0 removed that kwarg.
+    Args:
+        df: Frame to convert
+        zero_copy: Back the pandas columns with the Arrow buffers
+            (pd.ArrowDtype) instead of copying into NumPy blocks. Near-free
+            for large frames, but the sink must accept Arrow-backed dtypes.
+        low_memory: Convert column by column into NumPy dtypes, releasing
+            each Polars column as it goes so peak memory stays near one copy.
+            `df` is emptied in the process. Ignored when zero_copy is set.
+        **kwargs: Passed through to Polars' to_pandas (ignored by the modes above)
+    """
+    if zero_copy:
+        return _to_pandas_arrow_backed(df)
+    if low_memory:
+        return _to_pandas_column_wise(df)
+    return _to_pandas(df, **kwargs)
+
+
+def to_arrow(df: pl.DataFrame) -> "pa.Table":
+    """
+    Hand a Polars DataFrame to an Arrow-native consumer without going through pandas.
 
-    This helper tries the old signature, then falls back cleanly.
+    Polars exports its buffers as-is, so this is near-free. Prefer it over
+    to_pandas when the sink is DuckDB (from_arrow / register), pyarrow.parquet,
+    or another Polars/Arrow reader; keep to_pandas for pandas-only sinks
+    (Excel, DataFrame.to_sql).
     """
-    try:
-        # Old signature (will raise TypeError on newer Polars)
-        return df.to_pandas(use_pyarrow=False)  # type: ignore[call-arg]
-    except TypeError:
-        return df.to_pandas()
+    return df.to_arrow()
@@ -2,46 +2,92 @@
 Pipeline execution reporter - generates HTML reports with DBT integration
 """
 from __future__ import annotations
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
+import io
 import json
+import os
+import re
 
 from pipeline.common.logger import get_logger
 
 log = get_logger()
 
+# dbt.log line patterns, e.g.
+# "1 of 2 OK created sql table model landing.sgt_mbs_variables ............ [OK] in 0.07s"
+_MODEL_RE = re.compile(r'(\d+) of (\d+) (OK|ERROR) created? (\w+) (\w+) model ([\w.]+)')
+_TIME_RE = re.compile(r'in ([\d.]+)s')
+_TS_RE = re.compile(r'\[0m([\d:\.]+)')
+_COMPILING_RE = re.compile(r'Compiling model ([\w.]+)')
+
+# Parsed dbt artifacts and log summaries, keyed by (kind, path) and stored
+# with the (mtime_ns, size) they were read at. A long-running process (the
+# GUI) regenerates reports often; unchanged files are not re-read or re-parsed.
+# One entry per path, so a rewritten file replaces its stale entry.
+_DBT_CACHE: Dict[Tuple[str, Path], Tuple[Any, Any]] = {}
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it is missing"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _cached(kind: str, path: Path, key: Any, load: Callable[[], Any]) -> Any:
+    """Value from `load()`, reused while `key` for `path` is unchanged (results are shared, don't mutate)"""
+    hit = _DBT_CACHE.get((kind, path))
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    value = load()
+    _DBT_CACHE[(kind, path)] = (key, value)
+    return value
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file in one read; None if it is missing or unreadable"""
+    try:
+        # Bytes straight into the parser: no text-mode decode layer, and
+        # json.loads detects the encoding (incl. a UTF-8 BOM) itself
+        return json.loads(path.read_bytes())
+    except Exception:
+        return None
+
 
 def _load_dbt_results(dbt_dir: Path) -> Dict[str, Any]:
-    """Load DBT run results and manifest"""
+    """Load DBT run results and manifest (cached until either file changes)"""
+    target = dbt_dir / "target"
+    key = (_stat_key(target / "run_results.json"), _stat_key(target / "manifest.json"))
+    return _cached("dbt_results", target, key, lambda: _read_dbt_results(target))
+
+
+def _read_dbt_results(target: Path) -> Dict[str, Any]:
     results = {}
 
     # Load run_results.json
-    run_results_path = dbt_dir / "target" / "run_results.json"
-    if run_results_path.exists():
-        try:
-            with open(run_results_path, 'r', encoding='utf-8') as f:
-                results['run_results'] = json.load(f)
-        except Exception:
-            pass
+    run_results = _read_json(target / "run_results.json")
+    if run_results is not None:
+        results['run_results'] = run_results
 
     # Load manifest.json (metadata about models)
-    manifest_path = dbt_dir / "target" / "manifest.json"
-    if manifest_path.exists():
+    manifest = _read_json(target / "manifest.json")
+    if manifest is not None:
         try:
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
-                # Extract models, tests, sources, and documentation
-                results['models'] = {
-                    k: v for k, v in manifest.get('nodes', {}).items()
-                    if v.get('resource_type') in ['model', 'test', 'snapshot']
-                }
-                results['sources'] = manifest.get('sources', {})
-                results['docs'] = manifest.get('docs', {})
-                results['macros'] = {
-                    k: v for k, v in manifest.get('macros', {}).items()
-                    if not k.startswith('macro.dbt.')  # Exclude dbt built-in macros
-                }
+            # Extract models, tests, sources, and documentation
+            results['models'] = {
+                k: v for k, v in manifest.get('nodes', {}).items()
+                if v.get('resource_type') in ['model', 'test', 'snapshot']
+            }
+            results['sources'] = manifest.get('sources', {})
+            results['docs'] = manifest.get('docs', {})
+            results['macros'] = {
+                k: v for k, v in manifest.get('macros', {}).items()
+                if not k.startswith('macro.dbt.')  # Exclude dbt built-in macros
+            }
         except Exception:
             pass
 
@@ -49,21 +95,28 @@ def _load_dbt_results(dbt_dir: Path) -> Dict[str, Any]:
 
 
 def _parse_dbt_logs(log_path: Path) -> Dict[str, Any]:
-    """Parse DBT logs for detailed model information"""
-    if not log_path.exists():
+    """Parse DBT logs for detailed model information (cached until the log changes)"""
+    key = _stat_key(log_path)
+    if key is None:
         return {}
+    return _cached("dbt_log", log_path, key, lambda: _read_dbt_logs(log_path))
+
 
+def _read_dbt_logs(log_path: Path) -> Dict[str, Any]:
     model_details = []
     current_run = {}
 
     try:
         with open(log_path, 'r', encoding='utf-8') as f:
             for line in f:
+                # Cheap first tier: most lines mention neither, so skip them
+                # before the more specific checks and the regexes below
+                if 'creat' not in line and 'Compiling model' not in line:
+                    continue
+
                 # Extract model execution info
                 if 'OK created' in line or 'ERROR creating' in line:
-                    import re
-                    # Pattern: "1 of 2 OK created sql table model landing.sgt_mbs_variables ............ [OK] in 0.07s"
-                    match = re.search(r'(\d+) of (\d+) (OK|ERROR) created? (\w+) (\w+) model ([\w.]+)', line)
+                    match = _MODEL_RE.search(line)
                     if match:
                         status = match.group(3)
                         model_type = match.group(4)  # sql
@@ -71,11 +124,11 @@ def _parse_dbt_logs(log_path: Path) -> Dict[str, Any]:
                         model_name = match.group(6)  # landing.sgt_mbs_variables
 
                         # Extract timing
-                        time_match = re.search(r'in ([\d.]+)s', line)
+                        time_match = _TIME_RE.search(line)
                         exec_time = float(time_match.group(1)) if time_match else 0.0
 
                         # Extract timestamp
-                        ts_match = re.match(r'\[0m([\d:\.]+)', line)
+                        ts_match = _TS_RE.match(line)
                         timestamp = ts_match.group(1) if ts_match else ''
 
                         model_details.append({
@@ -90,7 +143,7 @@ def _parse_dbt_logs(log_path: Path) -> Dict[str, Any]:
 
                 # Extract compilation info
                 elif 'Compiling model' in line:
-                    match = re.search(r'Compiling model ([\w.]+)', line)
+                    match = _COMPILING_RE.search(line)
                     if match:
                         current_run['compiling'] = match.group(1)
 
@@ -100,20 +153,111 @@ def _parse_dbt_logs(log_path: Path) -> Dict[str, Any]:
     return {'model_details': model_details}
 
 
-def _load_pipeline_logs(log_path: Path) -> List[str]:
-    """Load recent pipeline logs"""
+def _load_pipeline_logs(log_path: Path, max_lines: int = 200, chunk_size: int = 64 * 1024) -> List[str]:
+    """Load recent pipeline logs (the last `max_lines` lines)"""
     if not log_path.exists():
         return []
 
     try:
-        with open(log_path, 'r', encoding='utf-8') as f:
-            # Get last 200 lines
-            lines = f.readlines()
-            return lines[-200:] if len(lines) > 200 else lines
+        with open(log_path, 'rb') as f:
+            # Read backwards in chunks until the tail holds more line breaks
+            # than lines wanted, so I/O is bounded by the tail, not the file
+            pos = f.seek(0, os.SEEK_END)
+            chunks = []
+            newlines = 0
+            while pos > 0 and newlines <= max_lines:
+                step = min(chunk_size, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                chunks.append(chunk)
+                newlines += chunk.count(b'\n')
+
+        # A cut mid-line (or mid-character) only affects the leading partial
+        # line, which falls outside the last `max_lines`
+        tail = b''.join(reversed(chunks)).decode('utf-8', errors='replace')
+        return list(deque(io.StringIO(tail, newline=None), maxlen=max_lines))
     except Exception:
         return []
 
 
+def _qident(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _collect_table_stats(
+    con: Any, estimate_row_counts: bool = False
+) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Row and column counts for every user table/view, as (table_stats, schema_stats).
+
+    Two set-based queries instead of two per table: column counts (and
+    DuckDB's stored row estimates) come from one grouped catalog query, and
+    the remaining row counts from a single UNION ALL. If that union fails
+    (e.g. a broken view), tables are counted one by one and the failing ones
+    are skipped.
+
+    With estimate_row_counts, tables use duckdb_tables().estimated_size
+    instead, a metadata lookup with no scan. It can overstate rows after
+    DELETEs (e.g. delete_insert/merge writes), so it is opt-in. Views have
+    no estimate and are always counted.
+    """
+    tables = con.execute("""
+        SELECT t.table_catalog, t.table_schema, t.table_name, COUNT(c.column_name), d.estimated_size
+        FROM information_schema.tables t
+        LEFT JOIN information_schema.columns c
+          ON c.table_catalog = t.table_catalog
+         AND c.table_schema = t.table_schema
+         AND c.table_name = t.table_name
+        LEFT JOIN duckdb_tables() d
+          ON d.database_name = t.table_catalog
+         AND d.schema_name = t.table_schema
+         AND d.table_name = t.table_name
+        WHERE t.table_schema NOT IN ('information_schema', 'pg_catalog')
+        GROUP BY t.table_catalog, t.table_schema, t.table_name, d.estimated_size
+        ORDER BY t.table_schema, t.table_name
+    """).fetchall()
+
+    counts: Dict[int, int] = {}
+    to_count = []
+    for i, (catalog, schema, table, _, estimate) in enumerate(tables):
+        if estimate is not None and estimate_row_counts:
+            counts[i] = estimate
+        else:
+            to_count.append((i, f"{_qident(catalog)}.{_qident(schema)}.{_qident(table)}"))
+
+    if to_count:
+        try:
+            counts.update(con.execute(" UNION ALL ".join(
+                f"SELECT {i}, COUNT(*) FROM {src}" for i, src in to_count
+            )).fetchall())
+        except Exception:
+            for i, src in to_count:
+                try:
+                    counts[i] = con.execute(f"SELECT COUNT(*) FROM {src}").fetchone()[0]
+                except Exception:
+                    pass
+
+    table_stats = []
+    schema_stats: Dict[str, List[Dict[str, Any]]] = {}
+    for i, (_, schema_name, table_name, cols, _) in enumerate(tables):
+        if i not in counts:
+            continue
+        schema_stats.setdefault(schema_name, []).append({
+            "table": table_name,
+            "rows": counts[i],
+            "columns": cols
+        })
+        table_stats.append({
+            "schema": schema_name,
+            "table": table_name,
+            "rows": counts[i],
+            "columns": cols
+        })
+
+    return table_stats, schema_stats
+
+
 def generate_pipeline_report(
     pipeline_name: str,
     jobs: List[Any],
@@ -164,48 +308,9 @@ def generate_pipeline_report(
     schema_stats = {}
     if duckdb_con:
         try:
-            # Get all tables from all schemas
-            schemas_query = """
-                SELECT DISTINCT table_schema
-                FROM information_schema.tables
-                WHERE table_schema NOT IN ('information_schema', 'pg_catalog')
-            """
-            schemas = duckdb_con.execute(schemas_query).fetchall()
-
-            for (schema_name,) in schemas:
-                tables = duckdb_con.execute(
-                    f"SELECT table_name FROM information_schema.tables WHERE table_schema = '{schema_name}'"
-                ).fetchall()
-
-                schema_tables = []
-                for (table_name,) in tables:
-                    try:
-                        count = duckdb_con.execute(
-                            f"SELECT COUNT(*) FROM {schema_name}.{table_name}"
-                        ).fetchone()[0]
-
-                        # Get column count
-                        cols = duckdb_con.execute(
-                            f"SELECT COUNT(*) FROM information_schema.columns WHERE table_schema = '{schema_name}' AND table_name = '{table_name}'"
-                        ).fetchone()[0]
-
-                        schema_tables.append({
-                            "table": table_name,
-                            "rows": count,
-                            "columns": cols
-                        })
-                        table_stats.append({
-                            "schema": schema_name,
-                            "table": table_name,
-                            "rows": count,
-                            "columns": cols
-                        })
-                    except Exception:
-                        pass
-
-                if schema_tables:
-                    schema_stats[schema_name] = schema_tables
-
+            table_stats, schema_stats = _collect_table_stats(
+                duckdb_con, estimate_row_counts=report_config.get("estimate_row_counts", False)
+            )
         except Exception:
             pass
 
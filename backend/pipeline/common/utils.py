@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import hashlib
+import marshal
+import mmap
+import os
 import re
 import time
 from pathlib import Path
-from typing import Any, Dict, Mapping, Optional
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, TypeVar, Union
 
 import yaml
 
@@ -13,6 +18,10 @@ __all__ = [
     "safe_mkdir",
     "clean_directory",
     "load_yaml",
+    "parse_yaml",
+    "map_file",
+    "load_yaml_cached",
+    "cached_by_content",
     "normalize_path",
     "resolve_placeholders",
 ]
@@ -26,8 +35,99 @@ def timestamp_file() -> str:
 def safe_mkdir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
+# libyaml-backed loader when available; falls back to the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_yaml_fallback_warned = False
+
+def _warn_yaml_fallback() -> None:
+    global _yaml_fallback_warned
+    if _yaml_fallback_warned or _YAML_LOADER is not yaml.SafeLoader:
+        return
+    _yaml_fallback_warned = True
+    from pipeline.common.logger import get_logger
+    get_logger().warning("libyaml not available, using slower pure-Python YAML loader")
+
+def parse_yaml(text: Union[str, bytes, mmap.mmap]) -> Any:
+    """Parse YAML (str, bytes or a mapped file) with the fastest available safe loader."""
+    _warn_yaml_fallback()
+    if isinstance(text, mmap.mmap):
+        text.seek(0)
+    return yaml.load(text, Loader=_YAML_LOADER)
+
+@contextmanager
+def map_file(fp: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Read-only mmap of `fp` (b"" for empty files, which cannot be mapped)."""
+    with open(fp, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
 def load_yaml(fp: Path) -> Dict[str, Any]:
-    return yaml.safe_load(fp.read_text(encoding="utf-8"))
+    with map_file(fp) as mm:
+        return parse_yaml(mm)
+
+T = TypeVar("T")
+
+CACHE_DIR = Path(os.environ.get("PIPELINE_CACHE_DIR") or Path.home() / ".cache" / "pipeline")
+# Newest cache entries kept; older ones are pruned after each write
+CACHE_MAX_ENTRIES = 32
+_CACHE_SUFFIX = ".marshal"
+
+def _prune_cache(keep: int) -> None:
+    """Delete all but the `keep` most recently used cache entries."""
+    entries = []
+    with os.scandir(CACHE_DIR) as it:
+        for e in it:
+            # .pkl: entries written by earlier versions of this cache
+            if e.is_file() and e.name.endswith((_CACHE_SUFFIX, ".pkl")):
+                entries.append((e.stat().st_mtime, e.path))
+    entries.sort(reverse=True)
+    for _, path in entries[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def cached_by_content(raw: Union[bytes, mmap.mmap], salt: str, build: Callable[[], T]) -> T:
+    """
+    Return build() memoized on disk under a blake2b hash of `raw` + `salt`.
+    Values are stored with marshal, so build() must return plain data (dicts,
+    lists, str, numbers, ...); anything else is simply not cached. At most
+    CACHE_MAX_ENTRIES entries are kept. Cache read/write failures are ignored;
+    the value is simply rebuilt.
+    """
+    h = hashlib.blake2b(raw, digest_size=20)
+    h.update(f"{salt}:marshal{marshal.version}".encode("utf-8"))
+    key = h.hexdigest()
+    cache_file = CACHE_DIR / f"{key}{_CACHE_SUFFIX}"
+    try:
+        with open(cache_file, "rb") as f:
+            value = marshal.load(f)
+        os.utime(cache_file)  # mark as recently used for pruning
+        return value
+    except Exception:
+        pass
+
+    value = build()
+    try:
+        data = marshal.dumps(value)
+        safe_mkdir(CACHE_DIR)
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, cache_file)  # atomic publish
+        _prune_cache(CACHE_MAX_ENTRIES)
+    except Exception:
+        pass
+    return value
+
+def load_yaml_cached(fp: Path) -> Dict[str, Any]:
+    """load_yaml() backed by the on-disk content-hash cache."""
+    salt = f"yaml:{yaml.__version__}:{_YAML_LOADER.__name__}"
+    with map_file(fp) as mm:
+        return cached_by_content(mm, salt, lambda: parse_yaml(mm))
 
 def normalize_path(p: Path) -> Path:
     return Path(str(p)).expanduser().resolve()
@@ -213,8 +213,10 @@ class PipelineValidator:
         """
         log.info("Validating pipeline configuration...")
 
-        # Basic structure validation
-        self._validate_structure()
+        # Basic structure validation; later checks assume a sound structure
+        if not self._validate_structure():
+            self._print_results()
+            return False
 
         # Schema validation
         self._validate_schemas()
@@ -233,12 +235,64 @@ class PipelineValidator:
 
         return len(self.errors) == 0
 
-    def _validate_structure(self):
-        """Validate basic pipeline structure."""
-        required = ["stages", "jobs"]
-        for section in required:
-            if section not in self.config:
+    def _validate_structure(self) -> bool:
+        """
+        Validate basic pipeline structure: required sections and job
+        stage/runner/dependency references.
+
+        Returns:
+            True if the structure is sound enough for the remaining checks
+        """
+        config = self.config
+        errors_before = len(self.errors)
+
+        stages = config.get("stages")
+        jobs = config.get("jobs")
+        runners = config.get("runners")
+        for section, value in (("stages", stages), ("jobs", jobs), ("runners", runners)):
+            if value is None:
                 self.errors.append(f"Missing required section: {section}")
+        if len(self.errors) > errors_before:
+            return False
+
+        if not stages:
+            self.errors.append("No stages defined")
+        if not jobs:
+            self.errors.append("No jobs defined")
+        if len(self.errors) > errors_before:
+            return False
+
+        # Membership tests bound to locals; this loop runs once per job
+        has_stage = set(stages).__contains__
+        has_job = set(jobs).__contains__
+        has_runner = runners.__contains__
+        for job_name, job_config in jobs.items():
+            job_get = job_config.get
+
+            job_stage = job_get("stage")
+            if job_stage is None:
+                self.errors.append(f"Job '{job_name}' missing required field: stage")
+            elif not has_stage(job_stage):
+                self.errors.append(f"Job '{job_name}' references unknown stage: {job_stage}")
+
+            runner_name = job_get("runner")
+            if runner_name is None:
+                self.errors.append(f"Job '{job_name}' missing required field: runner")
+            elif not has_runner(runner_name):
+                self.errors.append(f"Job '{job_name}' references unknown runner: {runner_name}")
+
+            for dep in job_get("depends_on") or []:
+                if not has_job(dep):
+                    self.errors.append(f"Job '{job_name}' depends on unknown job: {dep}")
+
+        if len(self.errors) > errors_before:
+            return False
+
+        log.success(f"Stages: {len(stages)}")
+        log.success(f"Jobs: {len(jobs)}")
+        log.success(f"Runners: {len(runners)}")
+        log.success("Dependencies validated")
+        return True
 
     def _validate_schemas(self):
         """Validate that referenced schemas are defined."""
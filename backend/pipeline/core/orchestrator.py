@@ -59,6 +59,17 @@ def _expand(obj: Any, env: Mapping[str, Any]) -> Any:
     return obj
 
 
+def _check_stager_options(job_name: str, options: Mapping[str, Any]) -> None:
+    """Validate stage job options against StagerOptions (only when a stager runs)."""
+    from pydantic import ValidationError
+    from pipeline.common.config_models import StagerOptions
+
+    try:
+        StagerOptions.model_validate(options)
+    except ValidationError as e:
+        log.warning(f"Job '{job_name}' has invalid stager options: {e}")
+
+
 # ============================================================================
 # Job & Stage Management
 # ============================================================================
@@ -360,7 +371,8 @@ class JobExecutor:
         try:
             schema = job.config.get("schema", "staging")
             input_tables = job.config.get("input", {}).get("tables", [])
-            options = job.config.get("options", {})
+            options = job.config.get("options") or {}
+            _check_stager_options(job.name, options)
             table_prefix = options.get("table_prefix", "")
             table_mapping = options.get("table_mapping", {})  # NEW: explicit name mapping
             as_table = options.get("as_table", True)  # Default to TABLE, not VIEW
@@ -1049,7 +1061,7 @@ def orchestrator(
         if report_config.get("enabled", False):
             try:
                 from pipeline.common.reporter import generate_pipeline_report
-                from pipeline.common.config_models import PipelineConfig, get_validation_summary
+                from pipeline.common.config_models import build_pipeline_config, get_validation_summary
 
                 pipeline_name = pipeline_meta.get('name', 'Unnamed')
                 report_path = out_dir / report_config.get("path", "report.html")
@@ -1057,7 +1069,7 @@ def orchestrator(
                 # Validate config and extract summary for report
                 config_validation_info = None
                 try:
-                    validated_config = PipelineConfig(**config)
+                    validated_config = build_pipeline_config(config)
                     config_validation_info = get_validation_summary(validated_config)
                     log.dev("Configuration validated successfully for reporting")
                 except Exception as e:
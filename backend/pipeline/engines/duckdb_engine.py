@@ -41,7 +41,8 @@ class DuckDBEngine(DatabaseEngine):
         """
         path = config.get("path", ":memory:")
         read_only = config.get("read_only", False)
-        db_config = config.get("config", {})
+        db_config = config.get("config") or {}
+        self._check_config(db_config)
 
         # Convert path to string and ensure directory exists
         if path and path != ":memory:":
@@ -79,6 +80,17 @@ class DuckDBEngine(DatabaseEngine):
 
         return conn
 
+    @staticmethod
+    def _check_config(db_config: Mapping[str, Any]) -> None:
+        """Validate engine options against DuckDBConfig (once per connection)."""
+        from pydantic import ValidationError
+        from pipeline.common.config_models import DuckDBConfig
+
+        try:
+            DuckDBConfig.model_validate(db_config)
+        except ValidationError as e:
+            log.warning(f"Invalid DuckDB config options: {e}")
+
     def execute(self, connection: duckdb.DuckDBPyConnection, sql: str) -> duckdb.DuckDBPyRelation:
         """Execute SQL and return DuckDB relation."""
         return connection.execute(sql)
@@ -143,13 +155,11 @@ class DuckDBEngine(DatabaseEngine):
             connection.execute(f"DROP TABLE IF EXISTS {full_table}")
             connection.execute(f"DROP VIEW IF EXISTS {full_table}")
 
-        # Convert polars → pandas → DuckDB relation
-        from pipeline.common.polars_to_pandas import to_pandas
-        pdf = to_pandas(table.df)
-        rel = connection.from_df(pdf)
+        # Hand polars → DuckDB relation over Arrow (no pandas copy)
+        from pipeline.common.polars_to_pandas import to_arrow
+        rel = connection.from_arrow(to_arrow(table.df))
 
-        row_count = len(pdf)
-        col_count = len(pdf.columns)
+        row_count, col_count = table.df.shape
 
         # Create table or view
         if as_table:
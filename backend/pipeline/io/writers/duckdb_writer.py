@@ -2,8 +2,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Mapping, Any, List, Tuple, Optional
 import duckdb
-import polars as pl
 
+from pipeline.common.polars_to_pandas import to_arrow
 from pipeline.plugins.api import Table, Writer
 from pipeline.plugins.registry import register_writer
 
@@ -12,10 +12,6 @@ def _qident(name: str) -> str:
     return '"' + str(name).replace('"', '""') + '"'
 
 
-def _pl_to_pandas(df: pl.DataFrame):
-    return df.to_pandas()
-
-
 def _table_info(con: duckdb.DuckDBPyConnection, schema: str, table: str) -> List[Tuple]:
     return con.execute(
         f"PRAGMA table_info({_qident(schema)}.{_qident(table)});"
@@ -75,7 +71,7 @@ class DuckDBWriter(Writer):
             _ensure_schema(con, schema)
 
             # Stage batch as a view
-            rel = con.from_df(_pl_to_pandas(table.df))
+            rel = con.from_arrow(to_arrow(table.df))
             rel.create_view("tmp_v", replace=True)
 
             view_to_use = "tmp_v"
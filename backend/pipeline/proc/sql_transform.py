@@ -8,6 +8,7 @@ import duckdb
 from pipeline.plugins.api import Processor
 from pipeline.plugins.registry import register_processor
 from pipeline.common.sql_template import SQLTemplateEngine
+from pipeline.common.polars_to_pandas import to_arrow
 
 def _strip_bom_ws(s: str) -> str:
     return s.replace("\ufeff", "").strip()
@@ -82,7 +83,7 @@ class SQLTransform(Processor):
             return df
 
         # Register input view
-        rel = con.from_df(df.to_pandas())
+        rel = con.from_arrow(to_arrow(df))
         rel.create_view(input_view, replace=True)
 
         try:
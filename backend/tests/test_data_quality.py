@@ -0,0 +1,25 @@
+import polars as pl
+
+from pipeline.common.data_quality import Expectation, ExpectationType, QualityAction, QualityValidator
+
+
+def _between(column, config):
+    return Expectation("bt", ExpectationType.BETWEEN, column, config=config, action=QualityAction.WARN)
+
+
+def test_between_string_bounds_are_literals():
+    df = pl.DataFrame({"s": ["a", "b", "zz", None]})
+
+    _, results = QualityValidator().validate(df, [_between("s", {"min": "a", "max": "b"})])
+
+    assert results[0].rows_failed == 1
+
+
+def test_between_date_string_bounds_on_lazy_frame():
+    lf = pl.LazyFrame({"d": ["2023-12-31", "2024-01-01", "2024-06-30", "2025-01-01"]})
+
+    _, results = QualityValidator().validate(
+        lf, [_between("d", {"min": "2024-01-01", "max": "2024-12-31"})]
+    )
+
+    assert results[0].rows_failed == 2